@@ -1,10 +1,78 @@
 """Bookmark management for tRead."""
 
-import json
+import atexit
+import functools
 import os
-from typing import Dict, Optional, Any
+import queue
+import threading
+from typing import Dict, Optional, Any, Set
 from dataclasses import dataclass
 
+try:
+    import orjson
+
+    def _dumps(data: Dict[str, Any]) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads
+except ImportError:
+    import json
+
+    def _dumps(data: Dict[str, Any]) -> bytes:
+        return json.dumps(data, indent=2).encode("utf-8")
+
+    _loads = json.loads
+
+
+class _FilenameTable(dict):
+    """str.translate table that drops characters not allowed in filenames.
+
+    Letters, digits, spaces, hyphens and underscores are kept; everything
+    else maps to None. Each code point is classified once and cached.
+    """
+
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        char = chr(codepoint)
+        value = codepoint if char.isalnum() or char in " -_" else None
+        self[codepoint] = value
+        return value
+
+
+_FILENAME_TABLE = _FilenameTable()
+
+# Seconds to wait for further saves before writing bookmarks to disk
+WRITE_DELAY = 0.5
+
+
+@functools.lru_cache(maxsize=1024)
+def _bookmark_path(bookmarks_dir: str, book_title: str) -> str:
+    """Build the bookmark file path for a book title.
+
+    Args:
+        bookmarks_dir: Directory holding bookmark files.
+        book_title: Title of the book.
+
+    Returns:
+        Path to the bookmark file.
+    """
+    # Sanitize filename
+    safe_title = book_title.translate(_FILENAME_TABLE).rstrip()
+    safe_title = safe_title.replace(" ", "_")
+    return os.path.join(bookmarks_dir, f"{safe_title}.json")
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    """Write a file via a temporary file so readers never see a partial write.
+
+    Args:
+        path: Destination file path.
+        data: Bytes to write.
+    """
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
 
 @dataclass
 class Bookmark:
@@ -55,6 +123,18 @@ class BookmarkManager:
         self.bookmarks_dir = os.path.abspath(self.bookmarks_dir)
         os.makedirs(self.bookmarks_dir, exist_ok=True)
 
+        # Bookmarks data per book title, kept in sync with the files on disk
+        self._cache: Dict[str, Dict[str, Any]] = {}
+
+        # Titles with saves not yet written. A background writer thread,
+        # started by the first save, flushes them once saves stop for
+        # WRITE_DELAY, and atexit drains whatever is left.
+        self._dirty: Set[str] = set()
+        self._lock = threading.Lock()  # Guards _cache and _dirty
+        self._write_lock = threading.Lock()  # Serializes file writes
+        self._queue: "queue.Queue[str]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+
     def _get_bookmark_file(self, book_title: str) -> str:
         """Get bookmark file path for a book.
 
@@ -64,16 +144,15 @@ class BookmarkManager:
         Returns:
             Path to the bookmark file.
         """
-        # Sanitize filename
-        safe_title = "".join(
-            c for c in book_title if c.isalnum() or c in (" ", "-", "_")
-        ).rstrip()
-        safe_title = safe_title.replace(" ", "_")
-        return os.path.join(self.bookmarks_dir, f"{safe_title}.json")
+        return _bookmark_path(self.bookmarks_dir, book_title)
 
     def save_bookmark(self, book_title: str, bookmark: Bookmark) -> bool:
         """Save a bookmark for a book.
 
+        The file is written on a background thread once no further save has
+        arrived for WRITE_DELAY seconds, so a burst of saves costs one write
+        and the caller never waits on disk I/O.
+
         Args:
             book_title: Title of the book.
             bookmark: Bookmark to save.
@@ -82,19 +161,69 @@ class BookmarkManager:
             True if successful, False otherwise.
         """
         try:
-            bookmark_file = self._get_bookmark_file(book_title)
             bookmarks_data = self._load_bookmarks_data(book_title)
+            with self._lock:
+                # Put the data back if the bookmark was deleted meanwhile
+                bookmarks_data = self._cache.setdefault(book_title, bookmarks_data)
 
-            # Save as the main bookmark (overwrite existing)
-            bookmarks_data["current"] = bookmark.to_dict()
+                # Save as the main bookmark (overwrite existing)
+                bookmarks_data["current"] = bookmark.to_dict()
 
-            with open(bookmark_file, "w", encoding="utf-8") as f:
-                json.dump(bookmarks_data, f, indent=2)
+                self._dirty.add(book_title)
+                self._start_writer()
+            self._queue.put(book_title)
             return True
         except Exception as e:
             print(f"Error saving bookmark: {e}")
             return False
 
+    def _start_writer(self) -> None:
+        """Start the background writer thread if it is not running yet.
+
+        The exit drain is registered along with it, so only managers that
+        have saved something are flushed, and kept alive, until exit.
+        """
+        if self._writer is None:
+            self._writer = threading.Thread(
+                target=self._writer_loop, name="bookmark-writer", daemon=True
+            )
+            self._writer.start()
+            atexit.register(self.flush)
+
+    def _writer_loop(self) -> None:
+        """Flush pending saves once no new save arrives for WRITE_DELAY."""
+        while True:
+            self._queue.get()
+            try:
+                while True:
+                    self._queue.get(timeout=WRITE_DELAY)
+            except queue.Empty:
+                pass
+            self.flush()
+
+    def flush(self) -> bool:
+        """Write all pending bookmark saves to disk.
+
+        Returns:
+            True if every pending bookmark was written, False otherwise.
+        """
+        with self._write_lock:
+            with self._lock:
+                dirty, self._dirty = self._dirty, set()
+                pending = [
+                    (self._get_bookmark_file(title), _dumps(self._cache[title]))
+                    for title in dirty
+                ]
+
+            success = True
+            for bookmark_file, data in pending:
+                try:
+                    _write_atomic(bookmark_file, data)
+                except Exception as e:
+                    print(f"Error saving bookmark: {e}")
+                    success = False
+            return success
+
     def load_bookmark(self, book_title: str) -> Optional[Bookmark]:
         """Load the current bookmark for a book.
 
@@ -106,30 +235,44 @@ class BookmarkManager:
         """
         try:
             bookmarks_data = self._load_bookmarks_data(book_title)
-            if "current" in bookmarks_data:
-                return Bookmark.from_dict(bookmarks_data["current"])
+            with self._lock:
+                current = bookmarks_data.get("current")
+            if current is not None:
+                return Bookmark.from_dict(current)
             return None
         except Exception as e:
             print(f"Error loading bookmark: {e}")
             return None
 
     def _load_bookmarks_data(self, book_title: str) -> Dict[str, Any]:
-        """Load bookmarks data from file.
+        """Load bookmarks data, reading the file only on the first access.
+
+        Must be called without holding _lock: the file is read outside it,
+        so other threads are not held up by the disk I/O.
 
         Args:
             book_title: Title of the book.
 
         Returns:
-            Dictionary containing bookmarks data.
+            Dictionary containing bookmarks data. It is shared through the
+            cache and must only be accessed while holding _lock.
         """
+        with self._lock:
+            data = self._cache.get(book_title)
+        if data is not None:
+            return data
+
+        data = {}
         bookmark_file = self._get_bookmark_file(book_title)
         if os.path.exists(bookmark_file):
             try:
-                with open(bookmark_file, "r", encoding="utf-8") as f:
-                    return json.load(f)
+                with open(bookmark_file, "rb") as f:
+                    data = _loads(f.read())
             except Exception:
                 pass
-        return {}
+        with self._lock:
+            # Another thread may have loaded the file meanwhile; keep its data
+            return self._cache.setdefault(book_title, data)
 
     def has_bookmark(self, book_title: str) -> bool:
         """Check if a book has a saved bookmark.
@@ -152,17 +295,32 @@ class BookmarkManager:
             True if successful, False otherwise.
         """
         try:
-            bookmark_file = self._get_bookmark_file(book_title)
-            if os.path.exists(bookmark_file):
-                bookmarks_data = self._load_bookmarks_data(book_title)
-                if "current" in bookmarks_data:
-                    del bookmarks_data["current"]
-                    if bookmarks_data:  # If there's other data, save it
-                        with open(bookmark_file, "w", encoding="utf-8") as f:
-                            json.dump(bookmarks_data, f, indent=2)
+            with self._write_lock:
+                bookmark_file = self._get_bookmark_file(book_title)
+                file_exists = os.path.exists(bookmark_file)
+                if file_exists:
+                    self._load_bookmarks_data(book_title)
+
+                with self._lock:
+                    self._dirty.discard(book_title)
+                    bookmarks_data = self._cache.pop(book_title, {})
+                    had_current = file_exists and "current" in bookmarks_data
+                    if had_current:
+                        del bookmarks_data["current"]
+                        remaining = _dumps(bookmarks_data) if bookmarks_data else None
+
+                if had_current:
+                    if remaining is not None:  # If there's other data, save it
+                        _write_atomic(bookmark_file, remaining)
                     else:  # If file is empty, delete it
                         os.remove(bookmark_file)
             return True
         except Exception as e:
             print(f"Error deleting bookmark: {e}")
             return False
+
+
+@functools.lru_cache(maxsize=None)
+def get_bookmark_manager() -> BookmarkManager:
+    """Return the global bookmark manager, creating it on first use."""
+    return BookmarkManager()
@@ -1,8 +1,14 @@
 """Configuration management module for tRead."""
 
-import json
+import functools
 import os
-from typing import Dict, Any, List
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Tuple
+
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
 
 
 class Config:
@@ -16,12 +22,28 @@ class Config:
             )
             config_path = os.path.abspath(config_path)
         self.config_path = config_path
-        self._config_data = self._load_config()
+        self._config_data = MappingProxyType(self._load_config())
+
+        # Sections are read on every key press, so resolve them once
+        self._keybinds = self._section("keybinds")
+        self._formatting = self._section("formatting")
+        self._bookmarks = self._section("bookmarks")
+        self._display = self._section("display")
+        self._reading = self._section("reading")
+        self._breakpoints = tuple(
+            sorted(
+                self._display.get("breakpoints", {}).values(),
+                key=lambda bp: bp.get("max_width", 9999),
+            )
+        )
+
+    def _section(self, name: str) -> Mapping[str, Any]:
+        return MappingProxyType(self._config_data.get(name, {}))
 
     def _load_config(self) -> Dict[str, Any]:
         try:
-            with open(self.config_path, "r") as f:
-                return json.load(f)
+            with open(self.config_path, "rb") as f:
+                return _loads(f.read())
         except Exception as e:
             print(f"[Warning] Could not load config.json: {e}")
             return self._get_default_config()
@@ -85,32 +107,32 @@ class Config:
         }
 
     @property
-    def keybinds(self) -> Dict[str, List[str]]:
-        return self._config_data.get("keybinds", {})
+    def keybinds(self) -> Mapping[str, List[str]]:
+        return self._keybinds
 
     @property
-    def formatting(self) -> Dict[str, Any]:
-        return self._config_data.get("formatting", {})
+    def formatting(self) -> Mapping[str, Any]:
+        return self._formatting
 
     @property
-    def bookmarks(self) -> Dict[str, Any]:
-        return self._config_data.get("bookmarks", {})
+    def bookmarks(self) -> Mapping[str, Any]:
+        return self._bookmarks
 
     @property
-    def display(self) -> Dict[str, Any]:
-        return self._config_data.get("display", {})
+    def display(self) -> Mapping[str, Any]:
+        return self._display
 
     @property
-    def reading(self) -> Dict[str, Any]:
-        return self._config_data.get("reading", {})
-
+    def reading(self) -> Mapping[str, Any]:
+        return self._reading
 
-# Global configuration instance
-_config = None
+    @property
+    def breakpoints(self) -> Tuple[Mapping[str, Any], ...]:
+        """Display breakpoints, sorted by max_width."""
+        return self._breakpoints
 
 
+@functools.lru_cache(maxsize=None)
 def get_config() -> Config:
-    global _config
-    if _config is None:
-        _config = Config()
-    return _config
+    """Return the global configuration instance, loading it on first use."""
+    return Config()
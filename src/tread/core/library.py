@@ -0,0 +1,118 @@
+"""Library metadata cache for tRead."""
+
+import os
+import threading
+from typing import Any, Dict, Iterable, Optional
+
+try:
+    import orjson
+
+    def _dumps(data: Dict[str, Any]) -> bytes:
+        return orjson.dumps(data)
+
+    _loads = orjson.loads
+except ImportError:
+    import json
+
+    def _dumps(data: Dict[str, Any]) -> bytes:
+        return json.dumps(data).encode("utf-8")
+
+    _loads = json.loads
+
+
+class LibraryCache:
+    """Caches the metadata shown on the library screen for each EPUB file.
+
+    Entries are keyed by file path and are only reused while the file's
+    size and modification time are unchanged, so books that have not been
+    touched since the last launch do not need to be opened again. Entries
+    may be read and stored from several threads at once.
+    """
+
+    def __init__(self, cache_path: str):
+        """Initialize the cache, loading any entries saved earlier.
+
+        Args:
+            cache_path: Path of the JSON file holding the cache.
+        """
+        self.cache_path = cache_path
+        self._entries = self._load()
+        self._changed = False
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.cache_path, "rb") as f:
+                data = _loads(f.read())
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def get(self, path: str, stat: os.stat_result) -> Optional[Dict[str, Any]]:
+        """Get cached metadata for a book file.
+
+        Args:
+            path: Path to the EPUB file.
+            stat: Current os.stat() result for the file.
+
+        Returns:
+            The cached metadata, or None if missing or out of date.
+        """
+        entry = self._entries.get(path)
+        if (
+            entry
+            and entry.get("mtime") == stat.st_mtime_ns
+            and entry.get("size") == stat.st_size
+        ):
+            return entry.get("info")
+        return None
+
+    def put(self, path: str, stat: os.stat_result, info: Dict[str, Any]) -> None:
+        """Store metadata for a book file.
+
+        Args:
+            path: Path to the EPUB file.
+            stat: os.stat() result the metadata was read under.
+            info: Metadata to cache.
+        """
+        entry = {"mtime": stat.st_mtime_ns, "size": stat.st_size, "info": info}
+        with self._lock:
+            self._entries[path] = entry
+            self._changed = True
+
+    def prune(self, paths: Iterable[str]) -> None:
+        """Drop entries for files that are no longer in the library.
+
+        Args:
+            paths: Paths of all books currently in the library.
+        """
+        keep = set(paths)
+        with self._lock:
+            for path in [path for path in self._entries if path not in keep]:
+                del self._entries[path]
+                self._changed = True
+
+    def save(self) -> bool:
+        """Write the cache to disk if it has changed.
+
+        Returns:
+            True if successful, False otherwise.
+        """
+        with self._lock:
+            if not self._changed:
+                return True
+            data = _dumps(self._entries)
+            # Cleared with the snapshot taken, so entries put while writing
+            # mark the cache as changed again
+            self._changed = False
+
+        tmp_path = self.cache_path + ".tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            with self._lock:
+                self._changed = True  # Try again on the next save
+            return False
+        return True
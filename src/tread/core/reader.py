@@ -2,240 +2,400 @@
 
 from ebooklib import epub
 from ebooklib import ITEM_DOCUMENT
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, NavigableString, Tag, XMLParsedAsHTMLWarning
+from lxml import etree
+import io
+import posixpath
 import re
-from typing import Dict, List
+import warnings
+import zipfile
+from collections.abc import Sequence
+from urllib.parse import unquote
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 from .config import get_config
 
+# lxml's C parser is much faster than the pure-Python html.parser backend.
+# ebooklib itself depends on lxml, so it is always available.
+_HTML_PARSER = "lxml"
+
+# Raw lxml parsers for the quick document scan done when a book is opened
+_SCAN_PARSER = etree.HTMLParser(remove_comments=True, remove_pis=True)
+_SCAN_PARSER_UTF8 = etree.HTMLParser(
+    encoding="utf-8", remove_comments=True, remove_pis=True
+)
+
+# Lenient XML parser for the container and package documents, as ebooklib uses
+_XML_PARSER = etree.XMLParser(recover=True, resolve_entities=False)
+
+# EPUB chapters are XHTML; parsing them as HTML is intended
+warnings.filterwarnings("ignore", category=XMLParsedAsHTMLWarning)
+
+# Whitespace patterns used when normalizing fallback text
+_MULTI_NEWLINE = re.compile(r"\n\s*\n\s*\n+")
+_HSPACE = re.compile(r"[ \t]+")
+
+# Metadata key, Dublin Core field and default value
+_METADATA_FIELDS = (
+    ("title", "title", "Unknown Title"),
+    ("author", "creator", "Unknown Author"),
+    ("language", "language", "Unknown"),
+    ("publisher", "publisher", "Unknown"),
+)
+
+# Metadata keys shown on the library screen
+_LIBRARY_FIELDS = frozenset(["title", "author"])
+
+# Inline tag name -> Rich markup (or plain text marker) wrapped around its text
+_INLINE_MARKUP = {
+    "b": ("[bold]", "[/bold]"),
+    "strong": ("[bold]", "[/bold]"),
+    "i": ("[italic]", "[/italic]"),
+    "em": ("[italic]", "[/italic]"),
+    "u": ("[underline]", "[/underline]"),
+    "code": ("`", "`"),
+    "tt": ("`", "`"),
+}
+
+# Block elements turned into paragraphs, and elements dropped entirely
+_BLOCK_TAGS = frozenset(
+    ["p", "h1", "h2", "h3", "h4", "h5", "h6", "div", "br", "blockquote"]
+)
+_REMOVED_TAGS = frozenset(["script", "style"])
+
+# Opening tag of any block element, matched against raw document bytes
+_BLOCK_TAG_BYTES = re.compile(
+    rb"<(?:p|h[1-6]|div|br|blockquote)(?![\w.:-])", re.IGNORECASE
+)
+
 
 class EpubBook:
     """Represents an EPUB book with parsed chapters and metadata."""
 
     def __init__(self, filepath: str):
         self.book = epub.read_epub(filepath)
-        self.chapters: List[Dict[str, str]] = []
         self.metadata: Dict[str, str] = {}
         self.formatting_config = get_config().formatting
+        self._formatter = ChapterFormatter(self.formatting_config)
+
+        # (title, item id, raw content) of every non-empty document, in spine
+        # order. Content is only formatted when a chapter is first accessed.
+        self._documents: List[Tuple[str, str, bytes]] = []
+        self._parsed: Dict[int, Dict[str, Any]] = {}
+        self.chapters = _LazyChapters(self)
+        self.chapter_titles: List[str] = []
+
         self._extract_metadata()
         self._extract_chapters()
 
     def _extract_metadata(self) -> None:
-        self.metadata = {
-            "title": self._get_metadata_field("title", "Unknown Title"),
-            "author": self._get_metadata_field("creator", "Unknown Author"),
-            "language": self._get_metadata_field("language", "Unknown"),
-            "publisher": self._get_metadata_field("publisher", "Unknown"),
-        }
-
-    def _get_metadata_field(self, field_name: str, default: str) -> str:
-        metadata = self.book.get_metadata("DC", field_name)
-        return metadata[0][0] if metadata else default
+        dublin_core = self.book.metadata.get(epub.NAMESPACES["DC"], {})
+        self.metadata = {}
+        for key, field_name, default in _METADATA_FIELDS:
+            values = dublin_core.get(field_name)
+            self.metadata[key] = values[0][0] if values else default
 
     def _extract_chapters(self) -> None:
-        spine_items = [
-            item for item in self.book.get_items() if item.get_type() == ITEM_DOCUMENT
-        ]
+        for item in self.book.get_items_of_type(ITEM_DOCUMENT):
+            raw = item.get_content()
+            title, has_text = _scan_document(raw)
+            if has_text:  # Only add non-empty chapters
+                if title is None:
+                    title = f"Chapter {len(self._documents) + 1}"
+                self._documents.append((title, item.get_id(), raw))
+                self.chapter_titles.append(title)
+
+    def _get_chapter(self, index: int) -> Dict[str, Any]:
+        """Get a chapter, formatting its content on first access.
+
+        Args:
+            index: Index of the chapter.
+
+        Returns:
+            Dictionary with the chapter's title, content and id, and the
+            content split into lines as "paragraphs" for wrapping.
+        """
+        chapter = self._parsed.get(index)
+        if chapter is None:
+            title, item_id, raw = self._documents[index]
+            content = self._formatter.format(raw)
+            chapter = {
+                "title": title,
+                "content": content,
+                "id": item_id,
+                "paragraphs": tuple(content.split("\n")),
+            }
+            self._parsed[index] = chapter
+        return chapter
+
+
+class _LazyChapters(Sequence):
+    """Read-only list of chapters that are formatted on first access."""
+
+    def __init__(self, book: EpubBook):
+        self._book = book
+
+    def __len__(self) -> int:
+        return len(self._book._documents)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("chapter index out of range")
+        return self._book._get_chapter(index)
+
+
+def _parse_document(raw: bytes) -> Optional[Any]:
+    # lxml assumes Latin-1 for HTML without a declared charset, but EPUB
+    # documents are UTF-8 unless they say otherwise
+    try:
+        raw.decode("utf-8")
+        parser = _SCAN_PARSER_UTF8
+    except UnicodeDecodeError:
+        parser = _SCAN_PARSER
+    try:
+        return etree.fromstring(raw, parser)
+    except (etree.XMLSyntaxError, ValueError):
+        return None
+
+
+def _scan_document(raw: bytes) -> Tuple[Optional[str], bool]:
+    """Quickly find a document's title and whether it has any text.
+
+    This parses with lxml directly, which is much cheaper than building a
+    BeautifulSoup tree. The answers match what full formatting produces: a
+    chapter is only empty when it has no text outside script/style.
+
+    Args:
+        raw: Raw XHTML content of the document.
+
+    Returns:
+        Tuple of (text of the first heading or None, has text).
+    """
+    root = _parse_document(raw)
+    if root is None:
+        return None, False
+
+    etree.strip_elements(root, "script", "style", with_tail=False)
+
+    title = None
+    heading = next(root.iter("h1", "h2", "h3", "title"), None)
+    if heading is not None:
+        title = "".join(heading.itertext()).strip()
+
+    has_text = any(text.strip() for text in root.itertext())
+    return title, has_text
+
+
+class _ContentBuffer:
+    """Collects chapter lines straight into a single text buffer."""
+
+    __slots__ = ("_buffer", "empty", "last_blank")
+
+    def __init__(self):
+        self._buffer = io.StringIO()
+        self.empty = True  # Nothing written yet
+        self.last_blank = False  # Last written line was empty
+
+    def append(self, line: str) -> None:
+        if not self.empty:
+            self._buffer.write("\n")
+        self._buffer.write(line)
+        self.empty = False
+        self.last_blank = line == ""
+
+    def append_blank_lines(self, count: int) -> None:
+        if count <= 0:
+            return
+        self._buffer.write("\n" * (count if not self.empty else count - 1))
+        self.empty = False
+        self.last_blank = True
+
+    def getvalue(self) -> str:
+        return self._buffer.getvalue()
+
 
-        for item in spine_items:
-            soup = BeautifulSoup(item.get_content(), "html.parser")
-            chapter_title = self._extract_chapter_title(soup, len(self.chapters) + 1)
-            content = self._format_html_content(soup)
+class ChapterFormatter:
+    """Converts chapter HTML into text with Rich markup."""
 
-            if content.strip():  # Only add non-empty chapters
-                self.chapters.append(
-                    {"title": chapter_title, "content": content, "id": item.get_id()}
-                )
+    def __init__(self, formatting_config: Mapping[str, Any]):
+        # Formatting options are needed for every element, so resolve them once
+        fc = formatting_config
+        self._paragraph_spacing = int(fc.get("paragraph_spacing", 1))
+        self._paragraph_indent = int(fc.get("paragraph_indent", 0))
+        self._preserve_line_breaks = bool(fc.get("preserve_line_breaks", True))
+        self._spacing_blanks = [""] * self._paragraph_spacing
+        self._indent_str = " " * self._paragraph_indent
 
-    def _extract_chapter_title(self, soup: BeautifulSoup, chapter_number: int) -> str:
-        title_tags = soup.find_all(["h1", "h2", "h3", "title"])
-        if title_tags:
-            return title_tags[0].get_text().strip()
-        return f"Chapter {chapter_number}"
+    def format(self, raw: bytes) -> str:
+        """Format a chapter document.
+
+        Args:
+            raw: Raw XHTML content of the chapter.
+
+        Returns:
+            Chapter text with Rich markup.
+        """
+        soup = BeautifulSoup(raw, _HTML_PARSER)
+        # Documents without any block tag (covers, navigation fragments) can
+        # only produce fallback text, so skip the block walk. UTF-16/32 input
+        # contains NUL bytes and is never matched against the byte pattern.
+        if b"\x00" not in raw and not _BLOCK_TAG_BYTES.search(raw):
+            return "\n".join(self._extract_fallback_content(soup))
+        return self._format_html_content(soup)
 
     def _format_html_content(self, soup: BeautifulSoup) -> str:
+        # Collect block elements and script/style elements in a single walk
+        # over the tree. Script and style contents are raw text, so no block
+        # element can sit inside one.
+        blocks = []
+        removed = []
+        for element in soup.descendants:
+            if isinstance(element, Tag):
+                if element.name in _BLOCK_TAGS:
+                    blocks.append(element)
+                elif element.name in _REMOVED_TAGS:
+                    removed.append(element)
+
         # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.extract()
+        for element in removed:
+            element.extract()
 
-        content = []
-        for element in soup.find_all(
-            ["p", "h1", "h2", "h3", "h4", "h5", "h6", "div", "br", "blockquote"]
-        ):
+        content = _ContentBuffer()
+        for element in blocks:
             self._process_html_element(element, content)
 
         # If no structured content found, fall back to text extraction
-        if not content:
-            content = self._extract_fallback_content(soup)
+        if content.empty:
+            return "\n".join(self._extract_fallback_content(soup))
 
-        return "\n".join([line for line in content if line is not None])
+        return content.getvalue()
 
-    def _process_html_element(self, element, content: List[str]) -> None:
-        paragraph_spacing = self.formatting_config.get("paragraph_spacing", 1)
-        paragraph_indent = self.formatting_config.get("paragraph_indent", 0)
-
-        # Skip title tags to avoid duplicate content
-        if element.name == "title":
-            return
+    def _process_html_element(self, element, content: _ContentBuffer) -> None:
+        # Title tags have no handler, which avoids duplicate content
+        handler = self._ELEMENT_HANDLERS.get(element.name)
+        if handler is not None:
+            handler(self, element, content)
 
-        if element.name in ["h1", "h2", "h3", "h4", "h5", "h6"]:
-            self._process_header_element(element, content, paragraph_spacing)
-        elif element.name == "p":
-            self._process_paragraph_element(
-                element, content, paragraph_spacing, paragraph_indent
-            )
-        elif element.name == "blockquote":
-            self._process_blockquote_element(
-                element, content, paragraph_spacing, paragraph_indent
-            )
-        elif element.name == "br":
-            self._process_break_element(content)
-        elif element.name == "div":
-            self._process_div_element(
-                element, content, paragraph_spacing, paragraph_indent
-            )
-
-    def _process_header_element(
-        self, element, content: List[str], paragraph_spacing: int
-    ) -> None:
+    def _process_header_element(self, element, content: _ContentBuffer) -> None:
         text = element.get_text().strip()
         if text:
-            if content:  # Add spacing before header only if there's content before
-                for _ in range(paragraph_spacing):
-                    content.append("")
+            # Add spacing before header only if there's content before
+            if not content.empty:
+                content.append_blank_lines(self._paragraph_spacing)
             content.append(f"[bold]{text}[/bold]")
-            for _ in range(paragraph_spacing):
-                content.append("")
-
-    def _process_paragraph_element(
-        self,
-        element,
-        content: List[str],
-        paragraph_spacing: int,
-        paragraph_indent: int,
-    ) -> None:
+            content.append_blank_lines(self._paragraph_spacing)
+
+    def _process_paragraph_element(self, element, content: _ContentBuffer) -> None:
         """Process paragraph elements.
 
         Args:
             element: Paragraph element to process.
-            content: Content list to append to.
-            paragraph_spacing: Number of empty lines to add after.
-            paragraph_indent: Number of spaces to indent paragraphs.
+            content: Content buffer to append to.
         """
         text = self._format_inline_elements(element)
         if text.strip():
-            text = self._apply_paragraph_indentation(text, element, paragraph_indent)
+            text = self._apply_paragraph_indentation(text)
             content.append(text)
-            for _ in range(paragraph_spacing):
-                content.append("")
-
-    def _process_blockquote_element(
-        self,
-        element,
-        content: List[str],
-        paragraph_spacing: int,
-        paragraph_indent: int,
-    ) -> None:
+            content.append_blank_lines(self._paragraph_spacing)
+
+    def _process_blockquote_element(self, element, content: _ContentBuffer) -> None:
         text = self._format_inline_elements(element)
         if text.strip():
             base_indent = "    "
-            if paragraph_indent > 0:
-                base_indent = " " * (paragraph_indent + 4)
+            if self._paragraph_indent > 0:
+                base_indent = self._indent_str + base_indent
             indented_text = base_indent + text.replace("\n", "\n" + base_indent)
             content.append(f"[italic]{indented_text}[/italic]")
-            for _ in range(paragraph_spacing):
-                content.append("")
+            content.append_blank_lines(self._paragraph_spacing)
 
-    def _process_break_element(self, content: List[str]) -> None:
-        preserve_line_breaks = self.formatting_config.get("preserve_line_breaks", True)
-        if preserve_line_breaks and content and content[-1] != "":
+    def _process_break_element(self, element, content: _ContentBuffer) -> None:
+        if self._preserve_line_breaks and not content.empty and not content.last_blank:
             content.append("")
 
-    def _process_div_element(
-        self, element, content: List[str], paragraph_spacing: int, paragraph_indent: int
-    ) -> None:
+    def _process_div_element(self, element, content: _ContentBuffer) -> None:
         text = self._format_inline_elements(element)
         if text.strip():
-            if paragraph_indent > 0:
-                indent = " " * paragraph_indent
-                text = indent + text.lstrip()
+            text = self._apply_paragraph_indentation(text)
             content.append(text)
-            for _ in range(paragraph_spacing):
-                content.append("")
-
-    def _apply_paragraph_indentation(
-        self, text: str, element, paragraph_indent: int
-    ) -> str:
-        if paragraph_indent > 0:
-            indent = " " * paragraph_indent
-            return indent + text.lstrip()
+            content.append_blank_lines(self._paragraph_spacing)
+
+    def _apply_paragraph_indentation(self, text: str) -> str:
+        if self._paragraph_indent > 0:
+            return self._indent_str + text.lstrip()
         return text
 
-    def _format_inline_elements(self, element) -> str:
-        from bs4 import NavigableString, Tag
+    # Block element name -> handler, used by _process_html_element
+    _ELEMENT_HANDLERS = {
+        **dict.fromkeys(
+            ["h1", "h2", "h3", "h4", "h5", "h6"], _process_header_element
+        ),
+        "p": _process_paragraph_element,
+        "blockquote": _process_blockquote_element,
+        "br": _process_break_element,
+        "div": _process_div_element,
+    }
 
+    def _format_inline_elements(self, element) -> str:
         # If element is a NavigableString, just return it
         if isinstance(element, NavigableString):
             return str(element)
 
-        # Process Tag elements
-        text_parts = []
-        for content in getattr(element, "contents", []):
-            if isinstance(content, Tag):
-                text_parts.append(self._process_inline_tag(content))
-            elif isinstance(content, NavigableString):
-                text_parts.append(str(content))
-
-        result = "".join(text_parts)
-        return self._clean_whitespace(result)
-
-    def _process_inline_tag(self, content) -> str:
-        inner_text = self._format_inline_elements(content)
-
-        if content.name in ["b", "strong"]:
-            return f"[bold]{inner_text}[/bold]"
-        elif content.name in ["i", "em"]:
-            return f"[italic]{inner_text}[/italic]"
-        elif content.name in ["u"]:
-            return f"[underline]{inner_text}[/underline]"
-        elif content.name in ["code", "tt"]:
-            return f"`{inner_text}`"
-        elif content.name in ["br"]:
+        contents = getattr(element, "contents", [])
+
+        # Fast path: plain text without any nested tags
+        if not any(isinstance(content, Tag) for content in contents):
+            return self._clean_whitespace("".join(contents))
+
+        # Walk nested tags with an explicit stack. Each tag's text is
+        # whitespace-normalized on its own before being wrapped in markup.
+        stack = [(element, iter(contents), [])]
+        while True:
+            tag, children, text_parts = stack[-1]
+            for content in children:
+                if isinstance(content, Tag):
+                    stack.append((content, iter(content.contents), []))
+                    break
+                if isinstance(content, NavigableString):
+                    text_parts.append(content)
+            else:
+                stack.pop()
+                result = self._clean_whitespace("".join(text_parts))
+                if not stack:
+                    return result
+                stack[-1][2].append(self._process_inline_tag(tag, result))
+
+    def _process_inline_tag(self, content, inner_text: str) -> str:
+        if content.name == "br":
             return "\n"
-        else:
-            # Recursively process other tags
+        markup = _INLINE_MARKUP.get(content.name)
+        if markup is None:
+            # Other tags contribute their text unchanged
             return inner_text
+        return f"{markup[0]}{inner_text}{markup[1]}"
 
     def _clean_whitespace(self, result: str) -> str:
         return " ".join(result.split())  # Normalize all whitespace
 
     def _extract_fallback_content(self, soup: BeautifulSoup) -> List[str]:
-        preserve_line_breaks = self.formatting_config.get("preserve_line_breaks", True)
-        paragraph_indent = self.formatting_config.get("paragraph_indent", 0)
-        paragraph_spacing = self.formatting_config.get("paragraph_spacing", 1)
-
         text = soup.get_text()
 
-        if preserve_line_breaks:
-            return self._process_text_with_line_breaks(
-                text, paragraph_indent, paragraph_spacing
-            )
+        if self._preserve_line_breaks:
+            return self._process_text_with_line_breaks(text)
         else:
-            return self._process_text_simple(text, paragraph_indent, paragraph_spacing)
-
-    def _process_text_with_line_breaks(
-        self,
-        text: str,
-        paragraph_indent: int,
-        paragraph_spacing: int,
-    ) -> List[str]:
+            return self._process_text_simple(text)
+
+    def _process_text_with_line_breaks(self, text: str) -> List[str]:
         lines = text.split("\n")
         processed_lines = []
 
         for line in lines:
             line = line.strip()
             if line:
-                if paragraph_indent > 0:
-                    processed_lines.append(" " * paragraph_indent + line)
+                if self._paragraph_indent > 0:
+                    processed_lines.append(self._indent_str + line)
                 else:
                     processed_lines.append(line)
             else:
@@ -252,18 +412,15 @@ class EpubBook:
                 while i < len(processed_lines) and not processed_lines[i]:
                     i += 1
                 # Add spacing after paragraph
-                for _ in range(paragraph_spacing):
-                    final_content.append("")
+                final_content.extend(self._spacing_blanks)
             else:
                 i += 1
         return final_content
 
-    def _process_text_simple(
-        self, text: str, paragraph_indent: int, paragraph_spacing: int
-    ) -> List[str]:
+    def _process_text_simple(self, text: str) -> List[str]:
         # Normalize whitespace
-        text = re.sub(r"\n\s*\n\s*\n+", "\n\n", text)
-        text = re.sub(r"[ \t]+", " ", text)
+        text = _MULTI_NEWLINE.sub("\n\n", text)
+        text = _HSPACE.sub(" ", text)
         paragraphs = text.split("\n\n")
 
         content = []
@@ -271,13 +428,99 @@ class EpubBook:
             paragraph = paragraph.strip()
             if paragraph:
                 paragraph = " ".join(paragraph.split())
-                if paragraph_indent > 0:
-                    paragraph = " " * paragraph_indent + paragraph
+                if self._paragraph_indent > 0:
+                    paragraph = self._indent_str + paragraph
                 content.append(paragraph)
-                for _ in range(paragraph_spacing):
-                    content.append("")
+                content.extend(self._spacing_blanks)
         return content
 
 
 def load_book(filepath: str) -> EpubBook:
     return EpubBook(filepath)
+
+
+def load_book_info(filepath: str) -> Dict[str, Any]:
+    """Read the library metadata of a book without loading its content.
+
+    Only the package document and the chapter documents are read from the
+    archive; images, fonts and stylesheets are skipped and nothing is
+    formatted. The chapter count matches what a fully loaded EpubBook
+    reports.
+
+    Args:
+        filepath: Path to the EPUB file.
+
+    Returns:
+        Dictionary with the book's title, author, cover flag and chapter count.
+    """
+    try:
+        archive = zipfile.ZipFile(filepath)
+    except zipfile.BadZipFile:
+        # Same error load_book reports, which is shown in the library
+        raise epub.EpubException(0, "Bad Zip file")
+
+    with archive:
+        container = etree.fromstring(
+            archive.read("META-INF/container.xml"), _XML_PARSER
+        )
+        opf_path = None
+        rootfile_tag = f"{{{epub.NAMESPACES['CONTAINERNS']}}}rootfile"
+        for rootfile in container.iter(rootfile_tag):
+            if rootfile.get("media-type") == "application/oebps-package+xml":
+                opf_path = rootfile.get("full-path")
+        if opf_path is None:
+            raise epub.EpubException(-1, "Can not find container file")
+        opf_dir = posixpath.dirname(opf_path)
+        package = etree.fromstring(
+            archive.read(posixpath.normpath(opf_path)), _XML_PARSER
+        )
+
+        opf_ns = epub.NAMESPACES["OPF"]
+        metadata = package.find(f"{{{opf_ns}}}metadata")
+        info: Dict[str, Any] = {}
+        for key, field_name, default in _METADATA_FIELDS:
+            if key in _LIBRARY_FIELDS:
+                element = metadata.find(f"{{{epub.NAMESPACES['DC']}}}{field_name}")
+                info[key] = element.text if element is not None else default
+
+        cover_ids = [
+            meta.get("content")
+            for meta in metadata.iter(f"{{{opf_ns}}}meta")
+            if meta.get("name") == "cover"
+        ]
+        has_cover = False
+        chapter_count = 0
+        manifest = package.find(f"{{{opf_ns}}}manifest")
+        for item in manifest.iter(f"{{{opf_ns}}}item"):
+            properties = item.get("properties", "").split()
+            if item.get("id") in cover_ids or "cover-image" in properties:
+                has_cover = True
+            if item.get("media-type") != "application/xhtml+xml":
+                continue
+            href = unquote(item.get("href"))
+            if "cover" in properties and "nav" not in properties:
+                # ebooklib replaces cover pages with its own titled template
+                has_cover = True
+                chapter_count += 1
+                continue
+            if "cover" in href.lower():
+                has_cover = True
+            raw = archive.read(posixpath.normpath(posixpath.join(opf_dir, href)))
+            if _body_has_text(raw):
+                chapter_count += 1
+
+    info["has_cover"] = has_cover
+    info["chapter_count"] = chapter_count
+    return info
+
+
+def _body_has_text(raw: bytes) -> bool:
+    # ebooklib rebuilds documents from the children of <body>, so text
+    # directly inside <body> or in <head> never reaches the chapter scan
+    root = _parse_document(raw)
+    body = root.find("body") if root is not None else None
+    if body is None:
+        return False
+    body.text = None
+    etree.strip_elements(body, "script", "style", with_tail=False)
+    return any(text.strip() for text in body.itertext())
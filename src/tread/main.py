@@ -1,18 +1,74 @@
 """Main entry point for tRead - Terminal EPUB Reader."""
 
+import functools
 import os
-from typing import List, Dict, Optional
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Dict, Optional, Tuple
 
-from .core.reader import load_book
-from .core.bookmarks import BookmarkManager
+from .core.reader import load_book, load_book_info
+from .core.bookmarks import get_bookmark_manager
+from .core.library import LibraryCache
 from .core.config import get_config
-from .utils.terminal import get_key, CursorManager
+from .utils.terminal import (
+    get_key,
+    has_pending_key,
+    CursorManager,
+    RawInput,
+    ResizeWatcher,
+)
 from .utils.colors import StyledConsole
+from .ui.controller import UIController
 from .ui.state import DisplayCalculator
-from rich.console import Console
+from rich.box import ROUNDED, Box
+from rich.console import Console, ConsoleOptions, Group, RenderResult
+from rich.control import Control
+from rich.markup import escape
+from rich.padding import Padding
 from rich.panel import Panel
+from rich.segment import Segment
+from rich.text import Text
 
 
+# Library metadata cache, stored next to config.json
+LIBRARY_CACHE_FILE = "_library_cache.json"
+
+
+# ASCII art logo heading the library and quit screens
+LOGO_LINES = (
+    "╔╦╗╦═╗╔═╗╔═╗╔╦╗",
+    " ║ ╠╦╝║╣ ╠═╣ ║║",
+    " ╩ ╩╚═╚═╝╩ ╩═╩╝",
+    "",
+)
+LIBRARY_HEADER = LOGO_LINES + ("[dim]Terminal EPUB Reader[/dim]", "")
+QUIT_HEADER = LOGO_LINES + (
+    "[dim]Terminal EPUB Reader - press h to see available commands[/dim]",
+    "",
+)
+
+# Title and author lengths shown in the library before truncating with "..."
+TITLE_DISPLAY_WIDTH = 40
+AUTHOR_DISPLAY_WIDTH = 25
+
+# Matches EPUB file names regardless of extension case
+EPUB_NAME_PATTERN = re.compile(r"\.epub\Z", re.IGNORECASE)
+
+# Library key -> (action, change in selected index)
+LIBRARY_KEY_ACTIONS = {
+    "q": ("quit", 0),
+    "\r": ("select", 0),  # Enter
+    "j": (None, 1),
+    "\x1b[B": (None, 1),  # Down arrow
+    "k": (None, -1),
+    "\x1b[A": (None, -1),  # Up arrow
+}
+
+# Upper bound on books opened in parallel when building the library
+MAX_LOAD_WORKERS = 8
+
+
+@functools.lru_cache(maxsize=None)
 def get_books_dir() -> str:
     config = get_config()
     books_dir = config._config_data.get("books_dir", "books")
@@ -28,6 +84,11 @@ def get_books_dir() -> str:
     return abs_books_dir
 
 
+def get_library_cache_path() -> str:
+    config_path = os.path.abspath(get_config().config_path)
+    return os.path.join(os.path.dirname(config_path), LIBRARY_CACHE_FILE)
+
+
 def get_console() -> StyledConsole:
     """Get a styled console instance with color configuration applied."""
     console = Console(highlight=False, color_system="truecolor")
@@ -42,27 +103,32 @@ def list_epub_files() -> List[str]:
     """
     books_dir = get_books_dir()
     try:
-        return [f for f in os.listdir(books_dir) if f.lower().endswith(".epub")]
+        with os.scandir(books_dir) as entries:
+            return [
+                entry.name
+                for entry in entries
+                if EPUB_NAME_PATTERN.search(entry.name) and entry.is_file()
+            ]
     except FileNotFoundError:
         return []
 
 
-def get_cover_info(epub_book) -> bool:
-    """Check if the EPUB book has a cover image.
+def get_book_metadata(path: str, library_cache: LibraryCache) -> Dict[str, Any]:
+    """Get the library metadata of a book, reading it only if not cached.
 
     Args:
-        epub_book: EpubBook instance to check.
+        path: Path to the EPUB file.
+        library_cache: Cache of metadata from earlier launches.
 
     Returns:
-        True if cover exists, False otherwise.
+        Dictionary with the book's title, author, cover flag and chapter count.
     """
-    try:
-        for item in epub_book.book.get_items():
-            if item.get_type() == 9 and "cover" in item.get_name().lower():
-                return True
-    except AttributeError:
-        pass
-    return False
+    stat = os.stat(path)
+    info = library_cache.get(path, stat)
+    if info is None:
+        info = load_book_info(path)
+        library_cache.put(path, stat, info)
+    return info
 
 
 def build_book_info_list(epub_files: List[str]) -> List[Dict[str, any]]:
@@ -75,28 +141,39 @@ def build_book_info_list(epub_files: List[str]) -> List[Dict[str, any]]:
         List of dictionaries containing book metadata.
     """
     books = []
-    bookmark_manager = BookmarkManager()
+    bookmark_manager = get_bookmark_manager()
+    library_cache = LibraryCache(get_library_cache_path())
 
     books_dir = get_books_dir()
-    for fname in epub_files:
+    paths = [os.path.join(books_dir, fname) for fname in epub_files]
+
+    # Reading book metadata is mostly ZIP reads and lxml parsing, so new or
+    # changed books are read in parallel. Results are collected in list order.
+    max_workers = max(1, min(MAX_LOAD_WORKERS, len(paths)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(get_book_metadata, path, library_cache) for path in paths
+        ]
+
+    for fname, path, future in zip(epub_files, paths, futures):
         try:
-            book = load_book(os.path.join(books_dir, fname))
-            has_cover = get_cover_info(book)
+            info = future.result()
 
             # Calculate reading progress
             progress = 0
-            if bookmark_manager.has_bookmark(book.metadata["title"]):
-                bookmark = bookmark_manager.load_bookmark(book.metadata["title"])
-                if bookmark and len(book.chapters) > 0:
+            if bookmark_manager.has_bookmark(info["title"]):
+                bookmark = bookmark_manager.load_bookmark(info["title"])
+                if bookmark and info["chapter_count"] > 0:
                     # Rough progress calculation based on chapter completion
-                    progress = int((bookmark.chapter / len(book.chapters)) * 100)
+                    progress = int((bookmark.chapter / info["chapter_count"]) * 100)
 
             books.append(
                 {
                     "filename": fname,
-                    "title": book.metadata["title"],
-                    "author": book.metadata["author"],
-                    "has_cover": has_cover,
+                    "path": path,
+                    "title": info["title"],
+                    "author": info["author"],
+                    "has_cover": info["has_cover"],
                     "progress": progress,
                 }
             )
@@ -104,17 +181,154 @@ def build_book_info_list(epub_files: List[str]) -> List[Dict[str, any]]:
             books.append(
                 {
                     "filename": fname,
+                    "path": path,
                     "title": "[Error reading]",
                     "author": str(e),
                     "has_cover": False,
                     "progress": 0,
                 }
             )
+
+    library_cache.prune(paths)
+    library_cache.save()
+
+    # Display strings never change, so format them once instead of per redraw
+    for book in books:
+        book["title_display"] = _truncate(book["title"], TITLE_DISPLAY_WIDTH)
+        book["author_display"] = _truncate(book["author"], AUTHOR_DISPLAY_WIDTH)
+        progress = book["progress"]
+        book["progress_display"] = f"{progress:3d}%" if progress > 0 else ""
     return books
 
 
+def _truncate(text: str, width: int) -> str:
+    return text[:width] + "..." if len(text) > width else text
+
+
+@functools.lru_cache(maxsize=256)
+def _markup_text(line: str) -> Text:
+    """Parse a line of Rich markup, reusing the result across redraws.
+
+    The logo, headings and most book entries are the same from one key
+    press to the next, so their markup is only parsed once. The returned
+    Text is shared and must not be modified.
+
+    Args:
+        line: A line of Rich markup.
+
+    Returns:
+        The parsed line.
+    """
+    return Text.from_markup(line)
+
+
+def _group_lines(lines: List[str]) -> Group:
+    # Group renders the cached lines directly instead of copying them all
+    # into one large Text
+    return Group(*[_markup_text(line) for line in lines])
+
+
+def _pad_lines(lines: List[str], padding_x: int) -> Group:
+    """Indent non-empty lines and group them for a single console print.
+
+    Each console.print() call parses markup and renders separately, so
+    borderless screens are printed as one Group instead of line by line.
+
+    Args:
+        lines: Lines of Rich markup.
+        padding_x: Number of spaces to indent non-empty lines by.
+
+    Returns:
+        The lines as a Group.
+    """
+    padding = Text(" " * padding_x)
+    blank = Text()
+    return Group(
+        *[padding + _markup_text(line) if line.strip() else blank for line in lines]
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _border_segments(box: Box, width: int) -> Tuple[Segment, Segment, Segment, Segment]:
+    inner = [width - 2]
+    return (
+        Segment(box.get_top(inner)),
+        Segment(box.mid_left),
+        Segment(box.mid_right),
+        Segment(box.get_bottom(inner)),
+    )
+
+
+class LibraryFrame:
+    """Bordered frame around the library screen.
+
+    Draws the same rounded border as an untitled Panel, but the border
+    segments for a given width are built once and reused on every redraw,
+    so only the lines inside the frame are rendered per key press.
+    """
+
+    def __init__(self, renderable: Any, padding_x: int, width: Optional[int] = None):
+        """Initialize the frame.
+
+        Args:
+            renderable: Content drawn inside the border.
+            padding_x: Horizontal padding between the border and the content.
+            width: Total width including the border, or None for full width.
+        """
+        self.renderable = renderable
+        self.padding_x = padding_x
+        self.width = width
+
+    def __rich_console__(
+        self, console: Console, options: ConsoleOptions
+    ) -> RenderResult:
+        width = (
+            options.max_width
+            if self.width is None
+            else min(options.max_width, self.width)
+        )
+        box = ROUNDED.substitute(options, safe=console.safe_box)
+        top, line_start, line_end, bottom = _border_segments(box, width)
+        padded = Padding(
+            self.renderable, (DisplayCalculator.PANEL_PADDING_Y, self.padding_x)
+        )
+        child_options = options.update(width=width - 2, height=None, highlight=False)
+        new_line = Segment.line()
+
+        yield top
+        yield new_line
+        for line in console.render_lines(padded, child_options):
+            yield line_start
+            yield from line
+            yield line_end
+            yield new_line
+        yield bottom
+        yield new_line
+
+
+def get_scroll_offset(selected: int, book_count: int, books_per_screen: int) -> int:
+    """Get the index of the first book shown, keeping the selection centered.
+
+    Args:
+        selected: Index of currently selected book.
+        book_count: Total number of books.
+        books_per_screen: Number of books that fit on screen.
+
+    Returns:
+        Index of the first visible book.
+    """
+    half_screen = books_per_screen // 2
+    scroll_offset = max(0, selected - half_screen)
+    return min(scroll_offset, max(0, book_count - books_per_screen))
+
+
 def display_book_selection_table(
-    books: List[Dict[str, any]], selected: int, console: StyledConsole
+    books: List[Dict[str, any]],
+    selected: int,
+    console: StyledConsole,
+    layout: Tuple[int, int, int],
+    show_border: bool,
+    clear: bool = True,
 ) -> None:
     """Display the book selection menu.
 
@@ -122,8 +336,12 @@ def display_book_selection_table(
         books: List of book information dictionaries.
         selected: Index of currently selected book.
         console: Rich Console instance.
+        layout: Panel width, visible height and horizontal padding.
+        show_border: Whether to draw the panel border.
+        clear: Clear the screen first. When False the previous frame, drawn
+            with the same layout, is overwritten in place.
     """
-    panel_width, _, visible_height, _ = DisplayCalculator.get_display_dimensions()
+    panel_width, visible_height, padding_x = layout
 
     # Calculate display window
     # Each book takes 3 lines (title, author, empty line)
@@ -132,23 +350,11 @@ def display_book_selection_table(
     available_lines = visible_height - header_lines
     books_per_screen = available_lines // 3  # Each book takes 3 lines
 
-    half_screen = books_per_screen // 2
-    scroll_offset = max(0, selected - half_screen)
-    scroll_offset = min(scroll_offset, max(0, len(books) - books_per_screen))
-
-    # ASCII art header
-    ascii_art = [
-        "╔╦╗╦═╗╔═╗╔═╗╔╦╗",
-        " ║ ╠╦╝║╣ ╠═╣ ║║",
-        " ╩ ╩╚═╚═╝╩ ╩═╩╝",
-        "",
-        "[dim]Terminal EPUB Reader[/dim]",
-        "",
-    ]
+    scroll_offset = get_scroll_offset(selected, len(books), books_per_screen)
 
     # Build book list
     book_lines = []
-    book_lines.extend(ascii_art)
+    book_lines.extend(LIBRARY_HEADER)
     book_lines.extend(["Your Library", ""])
 
     start_idx = scroll_offset
@@ -158,27 +364,17 @@ def display_book_selection_table(
         book = books[i]
         marker = "►" if i == selected else " "
 
-        # Progress indicator
-        progress = book.get("progress", 0)
-        if progress > 0:
-            progress_bar = f"{progress:3d}%"
-        else:
-            progress_bar = ""
-
-        # Format book entry
-        title = book["title"][:40] + "..." if len(book["title"]) > 40 else book["title"]
-        author = (
-            book["author"][:25] + "..." if len(book["author"]) > 25 else book["author"]
+        # Format book entry from the strings prepared by build_book_info_list
+        book_lines.append(f"{marker} [bold]{book['title_display']}[/bold]")
+        book_lines.append(
+            f"    [dim]by {book['author_display']}[/dim] {book['progress_display']}"
         )
-
-        book_lines.append(f"{marker} [bold]{title}[/bold]")
-        book_lines.append(f"    [dim]by {author}[/dim] {progress_bar}")
         book_lines.append("")
 
     # Add scroll indicators
     if start_idx > 0:
         # Find the first book line after ascii art
-        first_book_line = len(ascii_art) + 2
+        first_book_line = len(LIBRARY_HEADER) + 2
         book_lines[first_book_line] = "    [dim]... (more books above)[/dim]"
     if end_idx < len(books):
         book_lines.append("    [dim]... (more books below)[/dim]")
@@ -186,38 +382,27 @@ def display_book_selection_table(
     book_lines.append("")
 
     # Pad to fill screen
-    while len(book_lines) < visible_height:
-        book_lines.append("")
-
-    console.clear()
+    book_lines.extend(("",) * (visible_height - len(book_lines)))
 
-    # Check if borders should be shown
-    config = get_config()
-    show_border = config.display.get("show_border", True)
+    if clear:
+        console.clear()
+    else:
+        # Every frame covers the same cells, so moving the cursor home and
+        # writing over the last one avoids the blank flash of a full clear
+        console.control(Control.home())
 
     if show_border:
         console.print(
-            Panel(
-                "\n".join(book_lines),
-                title="",
-                padding=(
-                    DisplayCalculator.PANEL_PADDING_Y,
-                    DisplayCalculator.get_panel_padding_x(),
-                ),
+            LibraryFrame(
+                _group_lines(book_lines),
+                padding_x,
                 width=panel_width + 2 if panel_width > 0 else None,
             )
         )
     else:
         # Display without border
-        padding_x = DisplayCalculator.get_panel_padding_x()
-        padding_spaces = " " * padding_x
-
-        # Display content with padding
-        for line in book_lines:
-            if line.strip():  # Don't pad empty lines
-                console.print(f"{padding_spaces}{line}")
-            else:
-                console.print()
+        # Pad every row to the full width so shorter rows erase longer ones
+        console.print(_pad_lines(book_lines, padding_x), justify="left")
 
 
 def handle_book_selection_input(
@@ -233,16 +418,62 @@ def handle_book_selection_input(
     Returns:
         Tuple of (action, new_selected_index). Action can be 'quit', 'select', or None.
     """
-    if key == "q":
-        return "quit", selected
-    elif key == "\r":  # Enter
-        return "select", selected
-    elif key in ["j", "\x1b[B"]:  # Down
-        return None, min(selected + 1, max_books - 1)
-    elif key in ["k", "\x1b[A"]:  # Up
-        return None, max(selected - 1, 0)
+    action, step = LIBRARY_KEY_ACTIONS.get(key, (None, 0))
+    if step:
+        selected = max(0, min(selected + step, max_books - 1))
+    return action, selected
+
+
+def display_quit_confirmation(
+    console: StyledConsole, layout: Tuple[int, int, int], show_border: bool
+) -> None:
+    """Display the quit confirmation screen.
+
+    Args:
+        console: Rich Console instance.
+        layout: Panel width, visible height and horizontal padding.
+        show_border: Whether to draw the panel border.
+    """
+    panel_width, visible_height, padding_x = layout
+
+    # Build quit confirmation display
+    quit_lines = []
+    quit_lines.extend(QUIT_HEADER)
+    quit_lines.extend(["", "[bold]Really quit tRead? (Y/n)[/bold]", ""])
 
-    return None, selected
+    # Pad to fill screen
+    quit_lines.extend(("",) * (visible_height - len(quit_lines)))
+
+    console.clear()
+
+    if show_border:
+        console.print(
+            Panel(
+                _group_lines(quit_lines),
+                title="",
+                subtitle="[bold]Really quit tRead? (Y/n)[/bold]",
+                subtitle_align="center",
+                padding=(DisplayCalculator.PANEL_PADDING_Y, padding_x),
+                width=panel_width + 2 if panel_width > 0 else None,
+            )
+        )
+    else:
+        # Display subtitle/notification - center it manually
+        subtitle_text = "[bold]Really quit tRead? (Y/n)[/bold]"
+        subtitle_plain = "Really quit tRead? (Y/n)"
+        subtitle_width = len(subtitle_plain)
+        available_width = panel_width - (2 * padding_x)
+        subtitle_padding = max(0, (available_width - subtitle_width) // 2)
+        subtitle_line = " " * subtitle_padding + subtitle_text
+
+        # Content, a blank line and the subtitle in a single print
+        console.print(_pad_lines(quit_lines + ["", subtitle_line], padding_x))
+
+
+def get_library_layout() -> Tuple[int, int, int]:
+    """Get the panel width, visible height and padding for the library."""
+    dimensions = DisplayCalculator.snapshot()
+    return dimensions.panel_width, dimensions.visible_height, dimensions.padding_x
 
 
 def pick_book(console: StyledConsole) -> Optional[str]:
@@ -262,85 +493,53 @@ def pick_book(console: StyledConsole) -> Optional[str]:
 
     books = build_book_info_list(epub_files)
     selected = 0
+    show_border = get_config().display.get("show_border", True)
+    layout = None
+    last_frame = None
+
+    # Raw mode is held for the whole loop rather than switched per key
+    with ResizeWatcher() as resize_watcher, RawInput():
+        while True:
+            # Layout only changes when the terminal is resized
+            if resize_watcher.check():
+                layout = get_library_layout()
+
+            # The screen only depends on the selection and the layout, so
+            # keys that change neither (e.g. unbound keys) skip the redraw
+            frame = (selected, layout)
+            if frame != last_frame:
+                clear = last_frame is None or layout != last_frame[1]
+                display_book_selection_table(
+                    books, selected, console, layout, show_border, clear=clear
+                )
+                last_frame = frame
+            # Resizes wake the wait too; they match no key and only redraw
+            key = get_key(return_on_resize=True).lower()
+            action, selected = handle_book_selection_input(key, selected, len(books))
+
+            # Apply navigation keys that arrived during the redraw before
+            # drawing again, so holding a key redraws once per burst. Other
+            # keys stop the loop and are handled as usual.
+            while action is None and has_pending_key():
+                key = get_key().lower()
+                action, selected = handle_book_selection_input(
+                    key, selected, len(books)
+                )
 
-    while True:
-        display_book_selection_table(books, selected, console)
-        key = get_key().lower()
-        action, selected = handle_book_selection_input(key, selected, len(books))
-
-        if action == "quit":
-            # Show quit confirmation in the panel
-            panel_width, _, visible_height, _ = (
-                DisplayCalculator.get_display_dimensions()
-            )
-
-            # Build quit confirmation display
-            ascii_art = [
-                "╔╦╗╦═╗╔═╗╔═╗╔╦╗",
-                " ║ ╠╦╝║╣ ╠═╣ ║║",
-                " ╩ ╩╚═╚═╝╩ ╩═╩╝",
-                "",
-                "[dim]Terminal EPUB Reader - press h to see available commands[/dim]",
-                "",
-            ]
+            if action == "quit":
+                # Show quit confirmation in the panel
+                if resize_watcher.check():
+                    layout = get_library_layout()
+                display_quit_confirmation(console, layout, show_border)
 
-            quit_lines = []
-            quit_lines.extend(ascii_art)
-            quit_lines.extend(["", "[bold]Really quit tRead? (Y/n)[/bold]", ""])
-
-            # Pad to fill screen
-            while len(quit_lines) < visible_height:
-                quit_lines.append("")
-
-            console.clear()
-
-            # Check if borders should be shown
-            config = get_config()
-            show_border = config.display.get("show_border", True)
-
-            if show_border:
-                console.print(
-                    Panel(
-                        "\n".join(quit_lines),
-                        title="",
-                        subtitle="[bold]Really quit tRead? (Y/n)[/bold]",
-                        subtitle_align="center",
-                        padding=(
-                            DisplayCalculator.PANEL_PADDING_Y,
-                            DisplayCalculator.get_panel_padding_x(),
-                        ),
-                        width=panel_width + 2 if panel_width > 0 else None,
-                    )
-                )
-            else:
-                # Display without border - center content manually
-                padding_x = DisplayCalculator.get_panel_padding_x()
-                padding_spaces = " " * padding_x
-
-                # Display content with padding
-                for line in quit_lines:
-                    if line.strip():  # Don't pad empty lines
-                        console.print(f"{padding_spaces}{line}")
-                    else:
-                        console.print()
-
-                # Display subtitle/notification - center it manually
-                console.print()
-                subtitle_text = "[bold]Really quit tRead? (Y/n)[/bold]"
-                subtitle_plain = "Really quit tRead? (Y/n)"
-                subtitle_width = len(subtitle_plain)
-                available_width = panel_width - (2 * padding_x)
-                subtitle_padding = max(0, (available_width - subtitle_width) // 2)
-                subtitle_spaces = " " * (padding_x + subtitle_padding)
-                console.print(f"{subtitle_spaces}{subtitle_text}")
-
-            confirm = get_key().lower()
-            if confirm in ["n", "no"]:
-                continue
-            else:
-                return None
-        elif action == "select":
-            return os.path.join(get_books_dir(), books[selected]["filename"])
+                confirm = get_key().lower()
+                if confirm in ["n", "no"]:
+                    last_frame = None  # The confirmation replaced the list
+                    continue
+                else:
+                    return None
+            elif action == "select":
+                return books[selected]["path"]
 
 
 def main() -> None:
@@ -354,8 +553,6 @@ def main() -> None:
                 if not book_path:
                     break
                 epub_book = load_book(book_path)
-                from .ui.controller import UIController
-
                 controller = UIController(epub_book)
                 return_to_menu = controller.run()
                 controller.save_auto_bookmark()
@@ -365,7 +562,7 @@ def main() -> None:
         console.print("\n[yellow]Goodbye![/yellow]")
     except Exception as e:
         # Escape any Rich markup in the error message to prevent markup errors
-        error_msg = str(e).replace("[", "\\[").replace("]", "\\]")
+        error_msg = escape(str(e))
         console.print(f"[red]Error: {error_msg}[/red]")
 
 
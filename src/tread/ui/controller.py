@@ -1,9 +1,17 @@
 """Main UI controller for tRead."""
 
+from typing import Callable, Dict
+
 from rich.console import Console
 
 from ..core.config import get_config
-from ..utils.terminal import get_key
+from ..utils.terminal import (
+    RawInput,
+    get_key,
+    get_terminal_size,
+    has_pending_key,
+    track_resizes,
+)
 from ..utils.colors import StyledConsole
 from .state import ReadingState, DisplayCalculator, PageManager
 from .views import display_help_screen, display_chapter_menu, display_reading_page
@@ -23,6 +31,22 @@ class UIController:
         self.page_manager = PageManager(self.state)
         self.keybinds = get_config().keybinds
         self.config = get_config()
+        # Layout is computed several times per key press; cache the size
+        track_resizes()
+        # What the reading page on screen was drawn from, None if overdrawn
+        self._last_render_key = None
+        # Layout of the page on screen, used by the key handlers
+        self._chapter_pages = 1
+        self._text_width = 0
+        self._visible_height = 0
+        self._key_handlers = self._build_key_handlers()
+        # Handlers whose keys are applied together when they arrive in a burst
+        self._navigation_handlers = {
+            self._handle_next_page,
+            self._handle_prev_page,
+            self.state.next_chapter,
+            self.state.prev_chapter,
+        }
 
     def run(self) -> bool:
         """Main UI loop. Returns True if user wants to return to book select, False to exit."""
@@ -30,34 +54,40 @@ class UIController:
         if self.config.bookmarks.get("auto_load_bookmark_on_open", True):
             self.state.load_bookmark()
 
-        while True:
-            if self.state.show_help:
-                display_help_screen(self.console)
-                self.state.show_help = False
-                continue
-
-            if self.state.show_chapter_list:
-                should_close, new_chapter = display_chapter_menu(
-                    self.console, self.state.epub_book, self.state.current_chapter
-                )
-                if should_close:
-                    self.state.show_chapter_list = False
-                    self.state.current_page = (
-                        0  # Reset to first page when selecting chapter
+        # Raw mode is held for the whole loop rather than switched per key
+        with RawInput():
+            while True:
+                if self.state.show_help:
+                    display_help_screen(self.console)
+                    self.state.show_help = False
+                    self._last_render_key = None
+                    continue
+
+                if self.state.show_chapter_list:
+                    should_close, new_chapter = display_chapter_menu(
+                        self.console,
+                        self.state.epub_book,
+                        self.state.current_chapter,
                     )
-                else:
-                    self.state.current_chapter = new_chapter
-                continue
-
-            # Regular reading mode
-            if not self.state.epub_book.chapters:
-                self.console.clear()
-                self.console.print("No chapters found in this book.")
-                break
-
-            if not self._display_current_page():
-                # User pressed quit
-                return True
+                    if should_close:
+                        self.state.show_chapter_list = False
+                        self.state.current_page = (
+                            0  # Reset to first page when selecting chapter
+                        )
+                    else:
+                        self.state.current_chapter = new_chapter
+                    self._last_render_key = None
+                    continue
+
+                # Regular reading mode
+                if not self.state.epub_book.chapters:
+                    self.console.clear()
+                    self.console.print("No chapters found in this book.")
+                    break
+
+                if not self._display_current_page():
+                    # User pressed quit
+                    return True
         return False
 
     def save_auto_bookmark(self) -> None:
@@ -65,6 +95,8 @@ class UIController:
         if self.config.bookmarks.get("auto_bookmark_on_exit", True):
             if self.state.save_bookmark():
                 self.state.notification = "[green]Auto-saved bookmark[/green]"
+        # Leaving the book, so write any delayed saves out now
+        self.state.bookmark_manager.flush()
 
     def _display_current_page(self) -> bool:
         """Display current page and handle input.
@@ -77,76 +109,148 @@ class UIController:
             DisplayCalculator.get_display_dimensions()
         )
 
-        # Get current pages and progress
-        pages, progress_info = self.page_manager.get_current_pages(
+        # Get current page and progress
+        page_content, progress_info = self.page_manager.get_current_page(
             text_width, visible_height
         )
+        current_page = progress_info["current_page"]
+        total_pages = progress_info["chapter_pages"]
 
-        # Handle empty pages
-        if not pages:
-            page_content = [""]
-            current_page = 0
-            total_pages = 1
-        else:
-            page_content = pages[self.state.current_page]
-            current_page = self.state.current_page
-            total_pages = len(pages)
-
-        # Display the page
-        display_reading_page(
-            self.console,
-            self.state.epub_book,
-            self.state,
-            page_content,
-            progress_info,
+        # Skip redrawing when the key press changed nothing on screen
+        render_key = (
+            self.state.current_chapter,
             current_page,
-            total_pages,
+            progress_info["overall_progress"],
+            self.state.notification,
+            self.state.effective_double_page_mode(),
+            get_terminal_size(),
         )
+        if render_key != self._last_render_key or self.state.notification:
+            display_reading_page(
+                self.console,
+                self.state.epub_book,
+                self.state,
+                page_content,
+                progress_info,
+                current_page,
+                total_pages,
+                clear=self._needs_clear(render_key),
+            )
+            self._last_render_key = render_key
 
         # Handle user input
-        return self._handle_reading_input(pages, text_width, visible_height)
+        self._chapter_pages = total_pages
+        self._text_width = text_width
+        self._visible_height = visible_height
+        return self._handle_reading_input()
 
-    def _handle_reading_input(
-        self, pages, text_width: int, visible_height: int
-    ) -> bool:
-        """Handle user input during reading.
+    def _needs_clear(self, render_key: tuple) -> bool:
+        """Check whether the next reading page has to clear the screen.
+
+        A page drawn over the previous one covers the same cells only when
+        that was also a reading page for the same terminal size. A frame
+        that showed a notification has extra rows below the page, so it is
+        cleared away too.
 
         Args:
-            pages: Current chapter pages.
-            text_width: Width for text wrapping.
-            visible_height: Height for pagination.
+            render_key: Render key of the page about to be drawn.
+
+        Returns:
+            True if the screen should be cleared first, False otherwise.
+        """
+        last = self._last_render_key
+        return last is None or last[3] is not None or last[-1] != render_key[-1]
+
+    def _build_key_handlers(self) -> Dict[str, Callable[[], object]]:
+        """Map every bound key to the handler of its reading action.
+
+        Returns:
+            Dictionary from key to handler. A key bound to several actions
+            runs the first of them in the order below.
+        """
+        actions = (
+            ("chapter_menu", self._handle_chapter_menu),
+            ("help", self._handle_help),
+            ("bookmark_save", self._handle_save_bookmark),
+            ("bookmark_goto", self._handle_goto_bookmark),
+            ("next_page", self._handle_next_page),
+            ("prev_page", self._handle_prev_page),
+            ("next_chapter", self.state.next_chapter),
+            ("prev_chapter", self.state.prev_chapter),
+            ("start", self.state.goto_start),
+            ("end", self._handle_goto_end),
+            ("toggle_double_page", self.state.toggle_double_page_mode),
+        )
+        handlers: Dict[str, Callable[[], object]] = {}
+        for action, handler in actions:
+            for key in self.keybinds.get(action, []):
+                handlers.setdefault(key, handler)
+        return handlers
+
+    def _handle_reading_input(self) -> bool:
+        """Handle user input during reading.
 
         Returns:
             False if user wants to quit, True to continue.
         """
-        key = get_key().lower()
-
-        if key in self.keybinds["quit"]:
-            return False
-        elif key in self.keybinds["chapter_menu"]:
-            self.state.show_chapter_list = True
-        elif key in self.keybinds.get("help", []):
-            self.state.show_help = True
-        elif key in self.keybinds.get("bookmark_save", []):
-            self._handle_save_bookmark()
-        elif key in self.keybinds.get("bookmark_goto", []):
-            self._handle_goto_bookmark()
-        elif key in self.keybinds["next_page"]:
-            self._handle_next_page(pages)
-        elif key in self.keybinds["prev_page"]:
-            self._handle_prev_page(pages, text_width, visible_height)
-        elif key in self.keybinds["next_chapter"]:
-            self.state.next_chapter()
-        elif key in self.keybinds["prev_chapter"]:
-            self.state.prev_chapter()
-        elif key in self.keybinds["start"]:
-            self.state.goto_start()
-        elif key in self.keybinds["end"]:
-            self.state.goto_end(text_width, visible_height)
-        elif key in self.keybinds.get("toggle_double_page", []):
-            self.state.toggle_double_page_mode()
+        if self._count_pages_until_key():
+            # Redraw with progress through the book by pages, keeping any
+            # notification that is on screen
+            self.state.notification = self._last_render_key[3]
+            return True
+
+        # A resize matches no keybind, so the page is simply redrawn
+        key = get_key(return_on_resize=True).lower()
+
+        # Apply navigation keys that arrived during the redraw before drawing
+        # again, so holding a key redraws once per burst. Other keys stop the
+        # loop and are handled as usual.
+        while True:
+            if key in self.keybinds["quit"]:
+                return False
+            handler = self._key_handlers.get(key)
+            if handler is None:
+                return True
+            handler()
+            if handler not in self._navigation_handlers or not has_pending_key():
+                return True
+            # The page may have moved to another chapter
+            self._chapter_pages = max(
+                1,
+                self.page_manager.get_chapter_page_count(
+                    self.state.current_chapter, self._text_width, self._visible_height
+                ),
+            )
+            key = get_key().lower()
+
+    def _count_pages_until_key(self) -> bool:
+        """Count the pages of the other chapters while no key is pressed.
+
+        Only the chapter on screen is paginated to draw it, so the rest are
+        paginated here one at a time, stopping as soon as a key press or a
+        resize is waiting. The next and previous chapters go first, so
+        turning into them usually finds their pages ready.
+
+        Returns:
+            True if the page counts were completed, False otherwise.
+        """
+        size = get_terminal_size()
+        counted = False
+        while not has_pending_key() and get_terminal_size() == size:
+            if not self.page_manager.count_next_chapter(
+                self._text_width, self._visible_height
+            ):
+                return counted
+            counted = True
+        return False
+
+    def _handle_chapter_menu(self) -> None:
+        """Handle opening the chapter menu."""
+        self.state.show_chapter_list = True
 
-        return True
+    def _handle_help(self) -> None:
+        """Handle opening the help screen."""
+        self.state.show_help = True
 
     def _handle_save_bookmark(self) -> None:
         """Handle saving a bookmark."""
@@ -157,37 +261,30 @@ class UIController:
 
     def _handle_goto_bookmark(self) -> None:
         """Handle going to a saved bookmark."""
-        if self.state.has_bookmark():
-            if self.state.load_bookmark():
-                self.state.notification = (
-                    f"Jumped to bookmark: {self.state.get_bookmark_info()}"
-                )
-            else:
-                self.state.notification = "[red]Failed to load bookmark![/red]"
-        else:
+        if self.state.get_bookmark() is None:
             self.state.notification = (
                 "[yellow]No bookmark found for this book![/yellow]"
             )
+        elif self.state.load_bookmark():
+            self.state.notification = (
+                f"Jumped to bookmark: {self.state.get_bookmark_info()}"
+            )
+        else:
+            self.state.notification = "[red]Failed to load bookmark![/red]"
 
-    def _handle_next_page(self, pages) -> None:
-        """Handle next page navigation.
-
-        Args:
-            pages: Current chapter pages.
-        """
-        if not self.page_manager.next_page(pages):
+    def _handle_next_page(self) -> None:
+        """Handle next page navigation."""
+        if not self.page_manager.next_page(self._chapter_pages):
             # At end of chapter, try to go to next chapter
             self.state.next_chapter()
 
-    def _handle_prev_page(self, pages, text_width: int, visible_height: int) -> None:
-        """Handle previous page navigation.
+    def _handle_prev_page(self) -> None:
+        """Handle previous page navigation."""
+        self.page_manager.prev_page(self._text_width, self._visible_height)
 
-        Args:
-            pages: Current chapter pages.
-            text_width: Width for text wrapping.
-            visible_height: Height for pagination.
-        """
-        self.page_manager.prev_page(pages, text_width, visible_height)
+    def _handle_goto_end(self) -> None:
+        """Handle jumping to the last page of the book."""
+        self.page_manager.goto_end(self._text_width, self._visible_height)
 
 
 def display_book(epub_book) -> None:
@@ -1,16 +1,69 @@
 """UI state management and display logic for tRead."""
 
-from typing import Dict, Tuple, List
+import bisect
+import functools
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
 from datetime import datetime
 
 from ..utils.terminal import get_terminal_size
 from ..utils.text import (
-    wrap_text_to_width,
-    create_pages,
-    create_double_pages_with_width,
+    compose_double_page,
+    double_page_wrap_width,
+    wrap_paginate,
 )
-from ..core.bookmarks import BookmarkManager, Bookmark
-from ..core.config import get_config
+from ..core.bookmarks import Bookmark, get_bookmark_manager
+from ..core.config import Config, get_config
+
+
+@dataclass(frozen=True)
+class _LayoutSettings:
+    """Config values read while laying out every page."""
+
+    separator: str
+    # Breakpoints as parallel arrays, sorted by max_width for bisection
+    breakpoint_widths: Tuple[int, ...]
+    breakpoint_padding: Tuple[int, ...]
+    breakpoint_double: Tuple[bool, ...]
+    responsive_padding: bool
+    fallback_padding_x: int
+    double_page_default: bool
+
+
+@functools.lru_cache(maxsize=1)
+def _layout_settings(config: Config) -> _LayoutSettings:
+    display = config.display
+    breakpoints = config.breakpoints
+    return _LayoutSettings(
+        separator=config.reading.get("double_page_separator", " │ "),
+        breakpoint_widths=tuple(bp.get("max_width", 9999) for bp in breakpoints),
+        breakpoint_padding=tuple(bp.get("padding_x", 30) for bp in breakpoints),
+        breakpoint_double=tuple(
+            bp.get("double_page_mode", False) for bp in breakpoints
+        ),
+        responsive_padding=display.get("responsive_padding", True),
+        fallback_padding_x=display.get("fallback_padding_x", 30),
+        double_page_default=config.reading.get("double_page_mode", False),
+    )
+
+
+def get_layout_settings() -> _LayoutSettings:
+    """Get the layout settings of the current config, resolved once."""
+    return _layout_settings(get_config())
+
+
+# Marks a bookmark that has not been looked up yet
+_NOT_LOADED = object()
 
 
 class ReadingState:
@@ -22,9 +75,17 @@ class ReadingState:
         self.current_page = 0
         self.show_chapter_list = False
         self.show_help = False
-        self.bookmark_manager = BookmarkManager()
+        self.bookmark_manager = get_bookmark_manager()
+        self._bookmark = _NOT_LOADED  # Saved bookmark of this book, once read
         self.notification = None  # For UI notifications (e.g., bookmark saved)
-        self.double_page_mode = get_config().reading.get("double_page_mode", False)
+        self.double_page_mode = get_layout_settings().double_page_default
+        # Page mode chosen with the toggle key, None to follow the breakpoints
+        self._double_page_override: Optional[bool] = None
+        # Last page shown, its sanitized lines and the panel body parsed from
+        # them (None when drawn without a border), reused on redraws of it
+        self._sanitized_cache: Optional[Tuple[List[str], List[str], Any]] = None
+        # Rendered rows of the reading page on screen, None if overdrawn
+        self._frame_rows: Optional[List[str]] = None
 
     def is_valid_chapter(self, chapter_index: int) -> bool:
         return 0 <= chapter_index < len(self.epub_book.chapters)
@@ -57,27 +118,6 @@ class ReadingState:
         self.current_chapter = 0
         self.current_page = 0
 
-    def goto_end(self, text_width: int, visible_height: int) -> None:
-        from ..utils.terminal import get_terminal_size
-
-        terminal_width, _ = get_terminal_size()
-        self.current_chapter = len(self.epub_book.chapters) - 1
-        chapter = self.get_current_chapter()
-        double_page = self.effective_double_page_mode(terminal_width)
-        if double_page:
-            config = get_config()
-            separator = config.reading.get("double_page_separator", " │ ")
-            single_page_width = (text_width - len(separator)) // 2 - 2
-            lines = wrap_text_to_width(chapter["content"], max(20, single_page_width))
-        else:
-            lines = wrap_text_to_width(chapter["content"], text_width)
-        pages = create_pages(lines, visible_height)
-        if double_page:
-            config = get_config()
-            separator = config.reading.get("double_page_separator", " │ ")
-            pages = create_double_pages_with_width(pages, text_width, separator)
-        self.current_page = len(pages) - 1 if pages else 0
-
     def save_bookmark(self) -> bool:
         """Save current reading position as a bookmark.
 
@@ -92,13 +132,28 @@ class ReadingState:
                 timestamp=datetime.now().isoformat(),
                 title=chapter.get("title", f"Chapter {self.current_chapter + 1}"),
             )
-            return self.bookmark_manager.save_bookmark(
+            if not self.bookmark_manager.save_bookmark(
                 self.epub_book.metadata["title"], bookmark
-            )
+            ):
+                return False
+            self._bookmark = bookmark
+            return True
         except Exception as e:
             print(f"Error saving bookmark: {e}")
             return False
 
+    def get_bookmark(self) -> Optional[Bookmark]:
+        """Get the saved bookmark of the book, looking it up only once.
+
+        Returns:
+            The bookmark, or None if the book has none.
+        """
+        if self._bookmark is _NOT_LOADED:
+            self._bookmark = self.bookmark_manager.load_bookmark(
+                self.epub_book.metadata["title"]
+            )
+        return self._bookmark
+
     def load_bookmark(self) -> bool:
         """Load saved bookmark and navigate to that position.
 
@@ -106,9 +161,7 @@ class ReadingState:
             True if bookmark was loaded, False if no bookmark exists.
         """
         try:
-            bookmark = self.bookmark_manager.load_bookmark(
-                self.epub_book.metadata["title"]
-            )
+            bookmark = self.get_bookmark()
             if bookmark:
                 if self.is_valid_chapter(bookmark.chapter):
                     self.current_chapter = bookmark.chapter
@@ -125,7 +178,7 @@ class ReadingState:
         Returns:
             True if bookmark exists, False otherwise.
         """
-        return self.bookmark_manager.has_bookmark(self.epub_book.metadata["title"])
+        return self.get_bookmark() is not None
 
     def get_bookmark_info(self) -> str:
         """Get human-readable bookmark information.
@@ -134,9 +187,7 @@ class ReadingState:
             String describing the bookmark position.
         """
         try:
-            bookmark = self.bookmark_manager.load_bookmark(
-                self.epub_book.metadata["title"]
-            )
+            bookmark = self.get_bookmark()
             if bookmark:
                 chapter = (
                     self.epub_book.chapters[bookmark.chapter]
@@ -153,23 +204,19 @@ class ReadingState:
 
     def get_double_page_mode(self, terminal_width: int = None) -> bool:
         """Determine double page mode based on current breakpoint in config, using terminal width."""
-        config = get_config()
-        display = config.display
-        breakpoints = display.get("breakpoints", {})
         if terminal_width is None:
             # Get current terminal width
             terminal_width, _ = get_terminal_size()
         # Find the matching breakpoint
-        for bp in breakpoints.values():
-            if terminal_width <= bp.get("max_width", 9999):
-                return bp.get("double_page_mode", False)
+        settings = get_layout_settings()
+        index = bisect.bisect_left(settings.breakpoint_widths, terminal_width)
+        if index < len(settings.breakpoint_widths):
+            return settings.breakpoint_double[index]
         # Fallback
         return False
 
     def toggle_double_page_mode(self, terminal_width: int = None) -> None:
         """Toggle double page mode for the current breakpoint (overrides config for session)."""
-        if not hasattr(self, "_double_page_override"):
-            self._double_page_override = None
         current = self.get_double_page_mode(terminal_width)
         self._double_page_override = (
             not current
@@ -180,14 +227,22 @@ class ReadingState:
         self.notification = f"[blue]Switched to {mode_text} mode[/blue]"
 
     def effective_double_page_mode(self, terminal_width: int = None) -> bool:
-        if (
-            hasattr(self, "_double_page_override")
-            and self._double_page_override is not None
-        ):
+        if self._double_page_override is not None:
             return self._double_page_override
         return self.get_double_page_mode(terminal_width)
 
 
+class DisplayDimensions(NamedTuple):
+    """Layout dimensions of the screen for one terminal size."""
+
+    panel_width: int
+    text_width: int
+    visible_height: int
+    height: int
+    padding_x: int
+    size: Tuple[int, int]  # Terminal (width, height) these were computed for
+
+
 class DisplayCalculator:
     # Configuration constants
     PANEL_BORDER = 4
@@ -198,31 +253,37 @@ class DisplayCalculator:
     @classmethod
     def _get_responsive_padding_x(cls, terminal_width: int) -> int:
         """Calculate responsive horizontal padding based on terminal width."""
-        config = get_config()
-        display_config = config.display
+        settings = get_layout_settings()
 
         # Check if responsive padding is enabled
-        if not display_config.get("responsive_padding", True):
-            return display_config.get("fallback_padding_x", 30)
-
-        breakpoints = display_config.get("breakpoints", {})
-
-        # Sort breakpoints by max_width to find the right one
-        sorted_breakpoints = sorted(
-            breakpoints.items(), key=lambda x: x[1].get("max_width", 0)
-        )
+        if not settings.responsive_padding:
+            return settings.fallback_padding_x
 
         # Find the first breakpoint that accommodates our terminal width
-        for name, breakpoint in sorted_breakpoints:
-            if terminal_width <= breakpoint.get("max_width", 9999):
-                return breakpoint.get("padding_x", 30)
+        index = bisect.bisect_left(settings.breakpoint_widths, terminal_width)
+        if index < len(settings.breakpoint_widths):
+            return settings.breakpoint_padding[index]
 
         # Fallback if no breakpoint matches
-        return display_config.get("fallback_padding_x", 30)
+        return settings.fallback_padding_x
+
+    # Dimensions for the terminal size they were computed for
+    _snapshot: Optional[DisplayDimensions] = None
 
     @classmethod
-    def get_display_dimensions(cls) -> Tuple[int, int, int, int]:
+    def snapshot(cls) -> DisplayDimensions:
+        """Get all layout dimensions for the current terminal size.
+
+        The result is computed once per terminal size and reused by every
+        view drawing the same frame.
+
+        Returns:
+            DisplayDimensions for the current terminal size.
+        """
         width, height = get_terminal_size()
+        snapshot = cls._snapshot
+        if snapshot is not None and snapshot.size == (width, height):
+            return snapshot
 
         # Use responsive padding
         padding_x = cls._get_responsive_padding_x(width)
@@ -235,97 +296,232 @@ class DisplayCalculator:
             - cls.PANEL_HEIGHT_OFFSET
             - cls.PANEL_PADDING_Y * 2
         )
-        return panel_width, text_width, visible_height, height
+        snapshot = DisplayDimensions(
+            panel_width, text_width, visible_height, height, padding_x, (width, height)
+        )
+        cls._snapshot = snapshot
+        return snapshot
+
+    @classmethod
+    def get_display_dimensions(cls) -> Tuple[int, int, int, int]:
+        snapshot = cls.snapshot()
+        return (
+            snapshot.panel_width,
+            snapshot.text_width,
+            snapshot.visible_height,
+            snapshot.height,
+        )
 
     @classmethod
     def get_panel_padding_x(cls) -> int:
         """Get the current responsive horizontal padding value."""
-        width, _ = get_terminal_size()
-        return cls._get_responsive_padding_x(width)
+        return cls.snapshot().padding_x
 
 
 class PageManager:
     def __init__(self, state: ReadingState):
         self.state = state
+        # Paginated chapters by index, all for the layout in _pages_layout.
+        # Wrapping a chapter is by far the most expensive part of a redraw,
+        # so it is only redone when the layout changes. In double page mode
+        # these are the single pages; only the pair on screen is composed.
+        self._pages_cache: Dict[int, List[List[str]]] = {}
+        self._pages_layout: Optional[Tuple[int, int, bool, str]] = None
+        # wrap_paginate() bound to that layout, taking only chapter paragraphs
+        self._paginate: Callable[[Iterable[str]], Iterator[List[str]]] = wrap_paginate
+        # Pages before each chapter and in the whole book, for that layout
+        self._cumulative_pages: Optional[List[int]] = None
+
+    def _get_single_pages(
+        self, chapter_index: int, text_width: int, visible_height: int
+    ) -> List[List[str]]:
+        """Get the single pages of a chapter, paginating it only on first use.
+
+        Args:
+            chapter_index: Index of the chapter.
+            text_width: Width for text wrapping.
+            visible_height: Height for pagination.
 
-    def get_current_pages(
-        self, text_width: int, visible_height: int
-    ) -> Tuple[List[List[str]], Dict[str, int]]:
-        from ..utils.terminal import get_terminal_size
-
+        Returns:
+            The chapter's pages. The list is shared and must not be modified.
+        """
         terminal_width, _ = get_terminal_size()
-        chapter = self.state.get_current_chapter()
         double_page = self.state.effective_double_page_mode(terminal_width)
-        if double_page:
-            config = get_config()
-            separator = config.reading.get("double_page_separator", " │ ")
-            single_page_width = (text_width - len(separator)) // 2 - 2
-            lines = wrap_text_to_width(chapter["content"], max(20, single_page_width))
+        separator = get_layout_settings().separator
+        layout = (text_width, visible_height, double_page, separator)
+        if layout != self._pages_layout:
+            self._pages_cache.clear()
+            self._cumulative_pages = None
+            self._pages_layout = layout
+            if double_page:
+                text_width = double_page_wrap_width(text_width, separator)
+            self._paginate = functools.partial(
+                wrap_paginate, text_width=text_width, visible_height=visible_height
+            )
+
+        pages = self._pages_cache.get(chapter_index)
+        if pages is None:
+            pages = self._paginate_chapter(chapter_index)
+            self._pages_cache[chapter_index] = pages
+        return pages
+
+    def _paginate_chapter(self, chapter_index: int) -> List[List[str]]:
+        """Wrap and paginate a chapter for the current layout, bypassing the cache."""
+        if self.state.is_valid_chapter(chapter_index):
+            paragraphs = self.state.epub_book.chapters[chapter_index]["paragraphs"]
         else:
-            lines = wrap_text_to_width(chapter["content"], text_width)
-        pages = create_pages(lines, visible_height)
+            paragraphs = ("",)
+        return list(self._paginate(paragraphs))
+
+    def get_chapter_page_count(
+        self, chapter_index: int, text_width: int, visible_height: int
+    ) -> int:
+        """Get the number of pages shown for a chapter.
+
+        Args:
+            chapter_index: Index of the chapter.
+            text_width: Width for text wrapping.
+            visible_height: Height for pagination.
+
+        Returns:
+            Number of pages, counting each side-by-side pair in double page
+            mode as one.
+        """
+        pages = self._get_single_pages(chapter_index, text_width, visible_height)
+        if self._pages_layout[2]:
+            return (len(pages) + 1) // 2
+        return len(pages)
+
+    def get_page(
+        self, chapter_index: int, page_index: int, text_width: int, visible_height: int
+    ) -> List[str]:
+        """Get the lines of one page of a chapter.
+
+        Args:
+            chapter_index: Index of the chapter.
+            page_index: Index of the page, as counted by get_chapter_page_count().
+            text_width: Width for text wrapping.
+            visible_height: Height for pagination.
+
+        Returns:
+            The page's lines. In double page mode the pair is composed on
+            each call; single pages are shared and must not be modified.
+        """
+        pages = self._get_single_pages(chapter_index, text_width, visible_height)
+        _, _, double_page, separator = self._pages_layout
         if double_page:
-            config = get_config()
-            separator = config.reading.get("double_page_separator", " │ ")
-            pages = create_double_pages_with_width(pages, text_width, separator)
-        self.state.current_page = max(0, min(self.state.current_page, len(pages) - 1))
-        chapter_progress = (
-            int((self.state.current_page / len(pages) * 100)) if pages else 0
-        )
+            return compose_double_page(pages, page_index, text_width, separator)
+        return pages[page_index]
+
+    def count_next_chapter(self, text_width: int, visible_height: int) -> bool:
+        """Paginate the next chapter whose pages have not been counted yet.
+
+        Lets the page counts of the whole book be filled in one chapter at
+        a time, e.g. while waiting for a key press, instead of all at once.
+        Chapters nearest the current one go first, so the next and previous
+        chapters are usually paginated before the reader turns to them.
+
+        Args:
+            text_width: Width for text wrapping.
+            visible_height: Height for pagination.
+
+        Returns:
+            True if a chapter was paginated, False once every chapter is
+            counted.
+        """
+        # _get_single_pages() resets the counts when the layout has changed
+        self._get_single_pages(self.state.current_chapter, text_width, visible_height)
+        if self._cumulative_pages is not None:
+            return False
+        chapter_count = len(self.state.epub_book.chapters)
+        current = self.state.current_chapter
+        for distance in range(1, chapter_count):
+            for index in (current + distance, current - distance):
+                if 0 <= index < chapter_count and index not in self._pages_cache:
+                    self._get_single_pages(index, text_width, visible_height)
+                    return True
+
+        cumulative = [0]
+        for index in range(chapter_count):
+            count = self.get_chapter_page_count(index, text_width, visible_height)
+            cumulative.append(cumulative[-1] + count)
+        self._cumulative_pages = cumulative
+        return False
+
+    def get_current_page(
+        self, text_width: int, visible_height: int
+    ) -> Tuple[List[str], Dict[str, int]]:
+        """Get the page to display and the reading progress.
+
+        Only the current chapter is paginated. Progress through the book is
+        counted in pages once count_next_chapter() has counted every
+        chapter, and in chapters until then.
+
+        Args:
+            text_width: Width for text wrapping.
+            visible_height: Height for pagination.
+
+        Returns:
+            Tuple of (page_content, progress_info). progress_info also holds
+            the current page index and the number of pages in the chapter.
+        """
+        chapter = self.state.current_chapter
+        count = self.get_chapter_page_count(chapter, text_width, visible_height)
+        self.state.current_page = max(0, min(self.state.current_page, count - 1))
+        chapter_progress = self.state.current_page * 100 // count if count else 0
         total_chapters = len(self.state.epub_book.chapters)
-        overall_progress = int(
-            (
-                (self.state.current_chapter / total_chapters)
-                + (chapter_progress / 100 / total_chapters)
-            )
-            * 100
-        )
+
+        # Progress through the book by pages, so long chapters weigh more
+        cumulative = self._cumulative_pages
+        if cumulative is not None:
+            total_pages = cumulative[-1]
+            pages_read = cumulative[chapter] + self.state.current_page
+            overall_progress = pages_read * 100 // total_pages if total_pages else 0
+        else:
+            overall_progress = (chapter * 100 + chapter_progress) // total_chapters
+
         progress_info = {
             "chapter_progress": chapter_progress,
             "overall_progress": overall_progress,
             "total_chapters": total_chapters,
+            "current_page": self.state.current_page,
+            # An empty chapter is still shown as a single blank page
+            "chapter_pages": max(1, count),
         }
-        return pages, progress_info
+        if count:
+            page_content = self.get_page(
+                chapter, self.state.current_page, text_width, visible_height
+            )
+        else:
+            page_content = [""]
+        return page_content, progress_info
 
-    def next_page(self, pages: List[List[str]]) -> bool:
+    def next_page(self, chapter_pages: int) -> bool:
         """
         Move to next page.
         True if moved within chapter, False if need to change chapter.
         """
-        if self.state.current_page < len(pages) - 1:
+        if self.state.current_page < chapter_pages - 1:
             self.state.current_page += 1
             return True
         return False
 
-    def prev_page(
-        self, pages: List[List[str]], text_width: int, visible_height: int
-    ) -> bool:
-        from ..utils.terminal import get_terminal_size
-
-        terminal_width, _ = get_terminal_size()
+    def prev_page(self, text_width: int, visible_height: int) -> bool:
         if self.state.current_page > 0:
             self.state.current_page -= 1
             return True
         elif self.state.current_chapter > 0:
             self.state.current_chapter -= 1
-            prev_chapter = self.state.get_current_chapter()
-            double_page = self.state.effective_double_page_mode(terminal_width)
-            if double_page:
-                config = get_config()
-                separator = config.reading.get("double_page_separator", " │ ")
-                single_page_width = (text_width - len(separator)) // 2 - 2
-                prev_lines = wrap_text_to_width(
-                    prev_chapter["content"], max(20, single_page_width)
-                )
-            else:
-                prev_lines = wrap_text_to_width(prev_chapter["content"], text_width)
-            prev_pages = create_pages(prev_lines, visible_height)
-            if double_page:
-                config = get_config()
-                separator = config.reading.get("double_page_separator", " │ ")
-                prev_pages = create_double_pages_with_width(
-                    prev_pages, text_width, separator
-                )
-            self.state.current_page = len(prev_pages) - 1 if prev_pages else 0
+            count = self.get_chapter_page_count(
+                self.state.current_chapter, text_width, visible_height
+            )
+            self.state.current_page = max(0, count - 1)
             return True
         return False
+
+    def goto_end(self, text_width: int, visible_height: int) -> None:
+        self.state.current_chapter = len(self.state.epub_book.chapters) - 1
+        count = self.get_chapter_page_count(
+            self.state.current_chapter, text_width, visible_height
+        )
+        self.state.current_page = max(0, count - 1)
@@ -1,129 +1,184 @@
 """UI view components for tRead."""
 
-from typing import List, Dict
+import functools
+from typing import List, Dict, Sequence, Tuple
 from rich.panel import Panel
 
-from ..core.config import get_config
+from ..core.config import Config, get_config
 from ..utils.terminal import get_key
 from ..utils.text import sanitize_markup
 from ..utils.colors import get_styled_text, get_style, StyledConsole
 from .state import DisplayCalculator
 
 
-def display_help_screen(console: StyledConsole) -> None:
-    """Display the help screen with keybindings.
+# Help screen sections: heading and (keybind action, description) pairs
+_HELP_SECTIONS = (
+    (
+        "Navigation",
+        (
+            ("next_page", "Next page"),
+            ("prev_page", "Previous page"),
+            ("next_chapter", "Next chapter"),
+            ("prev_chapter", "Previous chapter"),
+            ("start", "Go to start"),
+            ("end", "Go to end"),
+        ),
+    ),
+    (
+        "Bookmarks",
+        (
+            ("bookmark_save", "Save bookmark"),
+            ("bookmark_goto", "Go to bookmark"),
+        ),
+    ),
+    ("Display", (("toggle_double_page", "Toggle double page mode"),)),
+    (
+        "Menu/System",
+        (
+            ("chapter_menu", "Chapter menu"),
+            ("help", "Help"),
+            ("quit", "Quit"),
+        ),
+    ),
+)
+
+
+def _display_key(key: str) -> str:
+    """Format a bound key for the help screen.
+
+    Printable keys are shown as they are; control characters and escape
+    sequences are shown escaped, e.g. ``\\x1b[A``.
 
     Args:
-        console: Rich Console instance.
+        key: Key string as returned by get_key().
+
+    Returns:
+        The text to show for the key.
     """
-    keybinds = get_config().keybinds
-    panel_width, _, visible_height, _ = DisplayCalculator.get_display_dimensions()
+    if key.isprintable() and "'" not in key and "\\" not in key:
+        return key
+    return repr(key).replace("'", "")
+
 
-    help_lines = [get_styled_text("Keybinds", "border"), ""]
+@functools.lru_cache(maxsize=1)
+def _help_lines(config: Config) -> Tuple[str, ...]:
+    """Build the help screen text for a config's keybinds and colors."""
+    keybinds = config.keybinds
+    help_lines = [get_styled_text("Keybinds", "border")]
 
     # Group keybinds by category for better organization
-    navigation_keys = {
-        "next_page": "Next page",
-        "prev_page": "Previous page",
-        "next_chapter": "Next chapter",
-        "prev_chapter": "Previous chapter",
-        "start": "Go to start",
-        "end": "Go to end",
-    }
-
-    bookmark_keys = {
-        "bookmark_save": "Save bookmark",
-        "bookmark_goto": "Go to bookmark",
-    }
-
-    display_keys = {
-        "toggle_double_page": "Toggle double page mode",
-    }
-
-    menu_keys = {
-        "chapter_menu": "Chapter menu",
-        "help": "Help",
-        "quit": "Quit",
-    }
-
-    help_lines.extend([get_styled_text("Navigation", "border")])
-    for action, description in navigation_keys.items():
-        if action in keybinds:
-            key_list = ", ".join(repr(k).replace("'", "") for k in keybinds[action])
-            help_lines.append(f"  [bold]{description}[/bold]: {key_list}")
-
-    help_lines.extend(["", get_styled_text("Bookmarks", "border")])
-    for action, description in bookmark_keys.items():
-        if action in keybinds:
-            key_list = ", ".join(repr(k).replace("'", "") for k in keybinds[action])
-            help_lines.append(f"  [bold]{description}[/bold]: {key_list}")
-
-    help_lines.extend(["", get_styled_text("Display", "border")])
-    for action, description in display_keys.items():
-        if action in keybinds:
-            key_list = ", ".join(repr(k).replace("'", "") for k in keybinds[action])
-            help_lines.append(f"  [bold]{description}[/bold]: {key_list}")
-
-    help_lines.extend(["", get_styled_text("Menu/System", "border")])
-    for action, description in menu_keys.items():
-        if action in keybinds:
-            key_list = ", ".join(repr(k).replace("'", "") for k in keybinds[action])
-            help_lines.append(f"  [bold]{description}[/bold]: {key_list}")
+    for heading, actions in _HELP_SECTIONS:
+        help_lines.extend(["", get_styled_text(heading, "border")])
+        for action, description in actions:
+            if action in keybinds:
+                key_list = ", ".join(map(_display_key, keybinds[action]))
+                help_lines.append(f"  [bold]{description}[/bold]: {key_list}")
 
     help_lines.extend(["", "Press any key to return."])
+    return tuple(help_lines)
 
-    # Pad to fill screen
-    while len(help_lines) < visible_height:
-        help_lines.append("")
 
-    console.clear()
+@functools.lru_cache(maxsize=64)
+def _center_indent(text_width: int, panel_width: int, padding_x: int) -> str:
+    """Get the indent that centers a borderless row in the panel area.
 
-    # Check if borders should be shown
+    Args:
+        text_width: Visible width of the row's text.
+        panel_width: Width of the panel area.
+        padding_x: Horizontal padding of the panel.
+
+    Returns:
+        Spaces to put before the row; rows too wide to center get only the
+        panel padding.
+    """
+    available_width = panel_width - (2 * padding_x)
+    return " " * (padding_x + max(0, (available_width - text_width) // 2))
+
+
+def _fill_rows(lines: Sequence[str], height: int) -> List[str]:
+    """Pad lines with blank rows so they fill the given height.
+
+    Args:
+        lines: Rows of the frame.
+        height: Number of rows the frame should have.
+
+    Returns:
+        A new list with the rows followed by the blank padding.
+    """
+    rows = list(lines)
+    rows.extend(("",) * (height - len(rows)))
+    return rows
+
+
+def _indent_rows(rows: List[str], padding_x: int) -> List[str]:
+    """Indent the non-blank rows of a borderless frame.
+
+    Args:
+        rows: Rows of the frame.
+        padding_x: Number of spaces to indent by.
+
+    Returns:
+        The rows with blank ones left empty.
+    """
+    padding_spaces = " " * padding_x
+    return [padding_spaces + line if line.strip() else "" for line in rows]
+
+
+def display_help_screen(console: StyledConsole) -> None:
+    """Display the help screen with keybindings.
+
+    Args:
+        console: Rich Console instance.
+    """
     config = get_config()
     show_border = config.display.get("show_border", True)
+    dimensions = DisplayCalculator.snapshot()
+    panel_width = dimensions.panel_width
+    visible_height = dimensions.visible_height
+    padding_x = dimensions.padding_x
+
+    # Pad to fill screen
+    help_lines = _fill_rows(_help_lines(config), visible_height)
+
+    console.clear()
 
     if show_border:
         console.print(
             Panel(
                 "\n".join(help_lines),
                 title="Help",
-                padding=(
-                    DisplayCalculator.PANEL_PADDING_Y,
-                    DisplayCalculator.get_panel_padding_x(),
-                ),
+                padding=(DisplayCalculator.PANEL_PADDING_Y, padding_x),
                 width=panel_width + 2 if panel_width > 0 else None,
                 border_style=get_style("border"),
             )
         )
     else:
         # Display without border
-        padding_x = DisplayCalculator.get_panel_padding_x()
-        padding_spaces = " " * padding_x
+        # Display title - center it manually
+        title_text = "[bold]Help[/bold]"
+        title_plain = "Help"
+        title_width = len(title_plain)
+        available_width = panel_width - (2 * padding_x)
+        title_padding = (available_width - title_width) // 2
+        title_spaces = " " * (padding_x + title_padding)
+        output_lines = [f"{title_spaces}{title_text}", ""]
 
-    # Display title - center it manually
-    title_text = "[bold]Help[/bold]"
-    title_plain = "Help"
-    title_width = len(title_plain)
-    available_width = panel_width - (2 * padding_x)
-    title_padding = (available_width - title_width) // 2
-    title_spaces = " " * (padding_x + title_padding)
-    console.print(f"{title_spaces}{title_text}")
-    console.print()
-
-    # Display content with padding
-    for line in help_lines:
-        if line.strip():  # Don't pad empty lines
-            console.print(f"{padding_spaces}{line}")
-        else:
-            console.print()
+        # Display content with padding, all in a single print
+        output_lines.extend(_indent_rows(help_lines, padding_x))
+        console.print("\n".join(output_lines))
     get_key()  # Wait for any key
 
 
 def display_chapter_menu(
     console: StyledConsole, epub_book, current_chapter: int
 ) -> tuple[bool, int]:
-    keybinds = get_config().keybinds
-    panel_width, _, visible_height, _ = DisplayCalculator.get_display_dimensions()
+    config = get_config()
+    keybinds = config.keybinds
+    show_border = config.display.get("show_border", True)
+    dimensions = DisplayCalculator.snapshot()
+    panel_width = dimensions.panel_width
+    visible_height = dimensions.visible_height
+    padding_x = dimensions.padding_x
 
     # Calculate chapter display window
     available_lines = visible_height - 4  # Reserve space for title, instructions
@@ -139,10 +194,12 @@ def display_chapter_menu(
     start_idx = scroll_offset
     end_idx = min(start_idx + available_lines, len(epub_book.chapters))
 
-    for i in range(start_idx, end_idx):
-        chapter = epub_book.chapters[i]
-        marker = ">" if i == current_chapter else " "
-        chapter_lines.append(f"{marker} {i+1:2d}. {chapter['title']}")
+    chapter_lines.extend(
+        f"{'>' if i == current_chapter else ' '} {i+1:2d}. {title}"
+        for i, title in enumerate(
+            epub_book.chapter_titles[start_idx:end_idx], start_idx
+        )
+    )
 
     # Add scroll indicators
     if start_idx > 0:
@@ -154,67 +211,53 @@ def display_chapter_menu(
     chapter_lines.append("Press Enter to select, 'c' to close, ↑↓ to navigate")
 
     # Pad to fill screen
-    while len(chapter_lines) < visible_height:
-        chapter_lines.append("")
+    chapter_lines = _fill_rows(chapter_lines, visible_height)
 
     console.clear()
 
-    # Check if borders should be shown
-    config = get_config()
-    show_border = config.display.get("show_border", True)
-
     if show_border:
         console.print(
             Panel(
                 "\n".join(chapter_lines),
                 title=f"{epub_book.metadata['title']} - by {epub_book.metadata['author']} | Chapter {current_chapter + 1}/{len(epub_book.chapters)}",
-                padding=(
-                    DisplayCalculator.PANEL_PADDING_Y,
-                    DisplayCalculator.get_panel_padding_x(),
-                ),
+                padding=(DisplayCalculator.PANEL_PADDING_Y, padding_x),
                 width=panel_width + 2 if panel_width > 0 else None,
             )
         )
     else:
         # Display without border
-        padding_x = DisplayCalculator.get_panel_padding_x()
-        padding_spaces = " " * padding_x
-
         # Display title - center it manually
         title = f"{epub_book.metadata['title']} - by {epub_book.metadata['author']} | Chapter {current_chapter + 1}/{len(epub_book.chapters)}"
         # Strip markup for width calculation
         title_plain = title.replace("[bold]", "").replace("[/bold]", "")
-        title_width = len(title_plain)
-        available_width = panel_width - (2 * padding_x)
-        title_padding = max(0, (available_width - title_width) // 2)
-        title_spaces = " " * (padding_x + title_padding)
-        console.print(f"{title_spaces}[bold]{title}[/bold]")
-        console.print()
-
-        # Display content with padding
-        for line in chapter_lines:
-            if line.strip():  # Don't pad empty lines
-                console.print(f"{padding_spaces}{line}")
-            else:
-                console.print()
-
-    key = get_key().lower()
-
-    if key in keybinds["chapter_menu_close"]:
-        return True, current_chapter
-    elif key in keybinds["chapter_menu_select"]:  # Enter key
-        return True, current_chapter  # Selection confirmed
-    elif key in keybinds["chapter_menu_down"]:
-        new_chapter = min(current_chapter + 1, len(epub_book.chapters) - 1)
-        return False, new_chapter
-    elif key in keybinds["chapter_menu_up"]:
-        new_chapter = max(current_chapter - 1, 0)
-        return False, new_chapter
-    elif key in keybinds.get("help", []):
-        display_help_screen(console)
-        return False, current_chapter
-
-    return False, current_chapter
+        title_spaces = _center_indent(len(title_plain), panel_width, padding_x)
+        output_lines = [f"{title_spaces}[bold]{title}[/bold]", ""]
+
+        # Display content with padding, all in a single print
+        output_lines.extend(_indent_rows(chapter_lines, padding_x))
+        console.print("\n".join(output_lines))
+
+    last_chapter = len(epub_book.chapters) - 1
+    while True:
+        key = get_key().lower()
+
+        if key in keybinds["chapter_menu_close"]:
+            return True, current_chapter
+        elif key in keybinds["chapter_menu_select"]:  # Enter key
+            return True, current_chapter  # Selection confirmed
+        elif key in keybinds["chapter_menu_down"]:
+            if current_chapter < last_chapter:
+                return False, current_chapter + 1
+        elif key in keybinds["chapter_menu_up"]:
+            if current_chapter > 0:
+                return False, current_chapter - 1
+        elif key in keybinds.get("help", []):
+            display_help_screen(console)
+            return False, current_chapter
+        elif not key:  # End of input
+            return False, current_chapter
+        # Anything else leaves the menu as drawn, so wait for the next key
+        # without redrawing it
 
 
 def display_reading_page(
@@ -225,8 +268,11 @@ def display_reading_page(
     progress_info: Dict[str, int],
     current_page: int,
     total_pages: int,
+    clear: bool = True,
 ) -> None:
-    panel_width, _, _, _ = DisplayCalculator.get_display_dimensions()
+    dimensions = DisplayCalculator.snapshot()
+    panel_width = dimensions.panel_width
+    padding_x = dimensions.padding_x
 
     chapter = state.get_current_chapter()
     overall_progress = progress_info["overall_progress"]
@@ -256,60 +302,95 @@ def display_reading_page(
         subtitle = ""
         subtitle_align = "center"
 
-    console.clear()
-
-    # Sanitize page content to prevent markup errors
-    sanitized_content = []
-    for line in page_content:
-        sanitized_content.append(sanitize_markup(line))
-
     # Check if borders should be shown
     config = get_config()
     show_border = config.display.get("show_border", True)
 
-    if show_border:
-        console.print(
-            Panel(
-                "\n".join(sanitized_content),
-                title=upper_bar,
-                title_align="center",
-                subtitle=subtitle,
-                subtitle_align=subtitle_align,
-                padding=(
-                    DisplayCalculator.PANEL_PADDING_Y,
-                    DisplayCalculator.get_panel_padding_x(),
-                ),
-                width=panel_width + 2 if panel_width > 0 else None,
-            )
-        )
+    # A borderless title too long for one row wraps, and the number of rows
+    # it takes can change from page to page
+    if clear or (not show_border and padding_x + len(upper_bar) > console.width):
+        console.clear()
+        state._frame_rows = None
+
+    # Sanitize page content to prevent markup errors. Most lines have no
+    # brackets at all, so those skip the call entirely, and redrawing the
+    # same page reuses the lines sanitized for it last time, along with the
+    # panel body already parsed from their markup
+    cached = state._sanitized_cache
+    if cached is not None and cached[0] == page_content:
+        _, sanitized_content, body = cached
     else:
-        # Display without border - center content manually
-        padding_x = DisplayCalculator.get_panel_padding_x()
-        padding_spaces = " " * padding_x
+        sanitized_content = [
+            line if "[" not in line else sanitize_markup(line)
+            for line in page_content
+        ]
+        body = None
+        if show_border:
+            body = console.render_str("\n".join(sanitized_content))
+        state._sanitized_cache = (list(page_content), sanitized_content, body)
+
+    # Render the frame off screen so it can be compared with the last one
+    with console.capture() as capture:
+        if show_border:
+            console.print(
+                Panel(
+                    body,
+                    title=upper_bar,
+                    title_align="center",
+                    subtitle=subtitle,
+                    subtitle_align=subtitle_align,
+                    padding=(DisplayCalculator.PANEL_PADDING_Y, padding_x),
+                    width=panel_width + 2 if panel_width > 0 else None,
+                )
+            )
+        else:
+            # Display without border - center content manually
+            padding_spaces = " " * padding_x
+
+            # Display title - center it manually
+            output_lines = []
+            if upper_bar:
+                title_spaces = _center_indent(
+                    len(upper_bar), panel_width, padding_x
+                )
+                output_lines.append(f"{title_spaces}[bold]{upper_bar}[/bold]")
+                output_lines.append("")
+
+            # Display content with padding
+            output_lines.extend(
+                padding_spaces + line for line in sanitized_content
+            )
 
-        # Display title - center it manually
-        if upper_bar:
-            upper_bar_plain = upper_bar
-            title_width = len(upper_bar_plain)
-            available_width = panel_width - (2 * padding_x)
-            title_padding = max(0, (available_width - title_width) // 2)
-            title_spaces = " " * (padding_x + title_padding)
-            console.print(f"{title_spaces}[bold]{upper_bar}[/bold]")
-            console.print()
-
-        # Display content with padding
-        for line in sanitized_content:
-            console.print(f"{padding_spaces}{line}")
-
-        # Display subtitle/notification - center it manually
-        if notification:
-            console.print()
-            notification_plain = notification
-            notif_width = len(notification_plain)
-            available_width = panel_width - (2 * padding_x)
-            notif_padding = max(0, (available_width - notif_width) // 2)
-            notif_spaces = " " * (padding_x + notif_padding)
-            console.print(f"{notif_spaces}{notification}")
+            # Display subtitle/notification - center it manually
+            if notification:
+                output_lines.append("")
+                notif_spaces = _center_indent(
+                    len(notification), panel_width, padding_x
+                )
+                output_lines.append(f"{notif_spaces}{notification}")
+
+            # Print the whole page at once rather than line by line, padding
+            # every row to the full width so shorter rows erase longer ones
+            console.print("\n".join(output_lines), justify="left")
+
+    # When the last frame was a reading page with the same layout, only the
+    # rows that changed are rewritten, each one covering its old contents
+    frame = capture.get()
+    rows = frame.split("\n")
+    previous = state._frame_rows
+    if previous is None or len(previous) != len(rows):
+        # Nothing to compare with, so the whole frame is written from the top
+        output = "\x1b[H" + frame
+    else:
+        output = "".join(
+            f"\x1b[{y};1H{row}"
+            for y, (old, row) in enumerate(zip(previous, rows), 1)
+            if row != old
+        )
+        output += f"\x1b[{len(rows)};1H"
+    console.file.write(output)
+    console.file.flush()
+    state._frame_rows = rows
 
     # Clear notification after displaying it once
     if notification:
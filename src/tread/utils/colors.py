@@ -1,9 +1,14 @@
 """Color and styling utilities for tRead."""
 
+import functools
+import sys
+from typing import Optional
+
 from rich.style import Style
-from rich.console import Console
+from rich.console import COLOR_SYSTEMS, Console
 
-from ..core.config import get_config
+from ..core.config import Config, get_config
+from ..utils.terminal import get_terminal_size
 
 
 class StyledConsole:
@@ -12,6 +17,9 @@ class StyledConsole:
     def __init__(self, console: Console):
         self.console = console
         self.base_style = self._get_base_style()
+        self._background_color = (
+            get_config().display.get("colors", {}).get("background", "")
+        )
 
     def _get_base_style(self) -> Style:
         """Get the base style with configured colors."""
@@ -40,30 +48,9 @@ class StyledConsole:
 
     def clear(self):
         """Clear console and apply background if configured."""
-        config = get_config()
-        colors = config.display.get("colors", {})
-        background_color = colors.get("background", "")
-
-        if background_color:
+        if self._background_color:
             # Clear with background color
-            from ..utils.terminal import get_terminal_size
-
-            width, height = get_terminal_size()
-
-            # Clear screen
-            import sys
-
-            sys.stdout.write("\033[2J\033[H")
-            sys.stdout.flush()
-
-            # Fill with background color
-            bg_style = Style(bgcolor=background_color)
-            for _ in range(height):
-                self.console.print(" " * width, style=bg_style, end="")
-
-            # Reset cursor to top
-            sys.stdout.write("\033[H")
-            sys.stdout.flush()
+            _fill_background(self.console, self._background_color)
         else:
             # Regular clear
             self.console.clear()
@@ -82,7 +69,12 @@ def get_style(element: str = "text") -> Style:
     Returns:
         Rich Style object with the configured colors, or default if not specified.
     """
-    config = get_config()
+    return _element_style(get_config(), element)
+
+
+@functools.lru_cache(maxsize=16)
+def _element_style(config: Config, element: str) -> Style:
+    """Build the style of a UI element from a config's colors."""
     colors = config.display.get("colors", {})
 
     background_color = colors.get("background", "")
@@ -118,28 +110,33 @@ def apply_background_to_console(console: Console) -> None:
     background_color = colors.get("background", "")
 
     if background_color:
-        # Set console background using Rich style
-        # Clear screen first
-        import sys
-
-        sys.stdout.write("\033[2J\033[H")  # Clear screen and move cursor to top
-        sys.stdout.flush()
+        _fill_background(console, background_color)
 
-        # Print background colored space to fill screen
-        from ..utils.terminal import get_terminal_size
 
-        width, height = get_terminal_size()
+def _fill_background(console: Console, background_color: str) -> None:
+    """Clear the screen and paint it with a background color.
 
-        # Create a style with background color
-        bg_style = Style(bgcolor=background_color)
-
-        # Fill the screen with background colored spaces
-        for _ in range(height):
-            console.print(" " * width, style=bg_style, end="")
-
-        # Reset cursor to top
-        sys.stdout.write("\033[H")
-        sys.stdout.flush()
+    Args:
+        console: Rich Console whose color system is used.
+        background_color: Color to fill the screen with.
+    """
+    width, height = get_terminal_size()
+    fill = _background_fill(width, height, background_color, console.color_system)
+
+    # Clear screen, fill it in a single write and move the cursor back to the top
+    sys.stdout.write(f"\033[2J\033[H{fill}\033[H")
+    sys.stdout.flush()
+
+
+@functools.lru_cache(maxsize=4)
+def _background_fill(
+    width: int, height: int, background_color: str, color_system: Optional[str]
+) -> str:
+    """Build the styled spaces covering a screen of the given size."""
+    style = Style(bgcolor=background_color)
+    return style.render(
+        " " * (width * height), color_system=COLOR_SYSTEMS.get(color_system)
+    )
 
 
 def get_console_style() -> Style:
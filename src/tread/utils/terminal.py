@@ -1,39 +1,253 @@
 """Terminal utility functions for tRead."""
 
+import codecs
 import sys
 import tty
 import termios
 import os
-from typing import Tuple
+import select
+import signal
+import threading
+from typing import Optional, Tuple
 
+# Input read from the terminal but not yet returned as keys. Reads go
+# straight to the file descriptor, so nothing is left buffered in sys.stdin.
+_input_buffer = ""
+_input_decoder: Optional[codecs.IncrementalDecoder] = None
 
-def get_terminal_size() -> Tuple[int, int]:
+# How long to wait for the rest of an escape sequence after a lone ESC
+ESCAPE_TIMEOUT = 0.05
+
+# (fd, normal attributes, raw mode attributes) of the terminal, queried once
+_tty_modes: Optional[Tuple[int, list, list]] = None
+
+# Number of RawInput contexts entered; the terminal is in raw mode while > 0
+_raw_input_depth = 0
+
+# Returned by get_key(return_on_resize=True) when the terminal was resized
+RESIZE_KEY = "<resize>"
+
+# Terminal size as last queried. Only cached once track_resizes() has set up
+# the SIGWINCH handler that clears it; each resize bumps the generation.
+_terminal_size: Optional[Tuple[int, int]] = None
+_resize_generation = 0
+_tracking_resizes = False
+
+# Self-pipe written by the SIGWINCH handler, so a get_key() blocked waiting
+# for input wakes up on resizes
+_wake_read_fd: Optional[int] = None
+_wake_write_fd: Optional[int] = None
+
+
+def _on_resize(signum, frame) -> None:
+    global _terminal_size, _resize_generation
+    _terminal_size = None
+    _resize_generation += 1
     try:
-        width, height = os.get_terminal_size()
+        os.write(_wake_write_fd, b"\0")
     except OSError:
-        width, height = 80, 24  # Default fallback
-    return width, height
+        pass  # Pipe full: a wakeup is pending anyway
 
 
-def get_key() -> str:
+def track_resizes() -> None:
+    """Start caching the terminal size, refreshing it on SIGWINCH.
+
+    Does nothing where SIGWINCH is not available, or when not called from
+    the main thread; the size is then queried on every call instead.
+    """
+    global _tracking_resizes, _wake_read_fd, _wake_write_fd
+    if _tracking_resizes or not hasattr(signal, "SIGWINCH"):
+        return
+    if threading.current_thread() is not threading.main_thread():
+        return
+    _wake_read_fd, _wake_write_fd = os.pipe()
+    os.set_blocking(_wake_read_fd, False)
+    os.set_blocking(_wake_write_fd, False)
+    signal.signal(signal.SIGWINCH, _on_resize)
+    _tracking_resizes = True
+
+
+def get_terminal_size() -> Tuple[int, int]:
+    global _terminal_size
+    size = _terminal_size
+    if size is None:
+        generation = _resize_generation
+        try:
+            width, height = os.get_terminal_size()
+        except OSError:
+            width, height = 80, 24  # Default fallback
+        size = (width, height)
+        if _tracking_resizes:
+            _terminal_size = size
+            # A resize signalled meanwhile makes this size stale already
+            if generation != _resize_generation:
+                _terminal_size = None
+    return size
+
+
+def get_key(return_on_resize: bool = False) -> str:
     """Get a single keypress from the user.
 
+    Blocks until a key is pressed. Once track_resizes() is active the wait
+    can also be ended by a terminal resize.
+
+    Args:
+        return_on_resize: Return RESIZE_KEY when the terminal is resized
+            while waiting, so the caller can redraw. Otherwise resizes are
+            ignored.
+
     Returns:
         String representation of the pressed key(s).
         Arrow keys return escape sequences like '\x1b[A'.
     """
     fd = sys.stdin.fileno()
-    old_settings = termios.tcgetattr(fd)
+    with RawInput():
+        key = _next_key(fd)
+        if key is None:
+            if _wake_read_fd is not None and not _wait_for_input(fd, return_on_resize):
+                return RESIZE_KEY
+            _read_input(fd)
+            key = _next_key(fd) or ""  # Empty at end of input
+    return key
+
+
+def _get_tty_modes(fd: int) -> Tuple[list, list]:
+    """Get the terminal's normal and raw mode attributes.
+
+    Both are worked out on first use, so each key read after that only
+    has to switch modes rather than query and rebuild them. Output
+    processing is left as it was in raw mode, so text printed while
+    RawInput holds the terminal in raw mode still starts new lines at the
+    left edge.
+
+    Returns:
+        Tuple of (normal_mode, raw_mode) attribute lists for tcsetattr().
+    """
+    global _tty_modes
+    if _tty_modes is None or _tty_modes[0] != fd:
+        normal_mode = termios.tcgetattr(fd)
+        try:
+            tty.setraw(fd, termios.TCSANOW)
+            raw_mode = termios.tcgetattr(fd)
+        finally:
+            termios.tcsetattr(fd, termios.TCSANOW, normal_mode)
+        raw_mode[1] = normal_mode[1]  # Output flags
+        _tty_modes = (fd, normal_mode, raw_mode)
+    return _tty_modes[1], _tty_modes[2]
+
+
+def _wait_for_input(fd: int, return_on_resize: bool) -> bool:
+    """Wait for input on fd or, optionally, a resize.
+
+    The terminal must already be in raw mode, otherwise input only becomes
+    readable once a full line has been entered.
+
+    Returns:
+        True when input is ready, False when the terminal was resized.
+    """
+    while True:
+        ready, _, _ = select.select([fd, _wake_read_fd], [], [])
+        if _wake_read_fd in ready:
+            _drain_wake_pipe()
+            if return_on_resize:
+                return False
+        if fd in ready:
+            return True
+
+
+def _drain_wake_pipe() -> None:
     try:
-        tty.setraw(fd)
-        key = sys.stdin.read(1)
-        if key == "\x1b":  # Handle arrow keys and other escape sequences
-            key += sys.stdin.read(2)
-    finally:
-        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+        while os.read(_wake_read_fd, 512):
+            pass
+    except BlockingIOError:
+        pass
+
+
+def _read_input(fd: int, timeout: Optional[float] = None) -> bool:
+    """Read the input waiting on fd into the input buffer.
+
+    Args:
+        fd: File descriptor of the terminal, in raw mode.
+        timeout: Seconds to wait for input, or None to block until some
+            arrives.
+
+    Returns:
+        True if any input was read.
+    """
+    global _input_buffer, _input_decoder
+    if timeout is not None:
+        ready, _, _ = select.select([fd], [], [], timeout)
+        if not ready:
+            return False
+    data = os.read(fd, 1024)
+    if not data:
+        return False
+    if _input_decoder is None:
+        encoding = getattr(sys.stdin, "encoding", None) or "utf-8"
+        _input_decoder = codecs.getincrementaldecoder(encoding)("replace")
+    _input_buffer += _input_decoder.decode(data)
+    return True
+
+
+def _escape_sequence_end(text: str) -> int:
+    """Find the end of the escape sequence at the start of text.
+
+    Returns:
+        Length of the sequence, or -1 if more input is needed to tell.
+    """
+    if len(text) < 2:
+        return -1
+    if text[1] == "[":  # CSI: parameters and intermediates, then a final byte
+        for i in range(2, len(text)):
+            code = ord(text[i])
+            if 0x40 <= code <= 0x7E:
+                return i + 1
+            if not 0x20 <= code <= 0x3F:
+                return i  # Malformed; end the sequence before this character
+        return -1
+    if text[1] == "O":  # SS3, as sent by some terminals for arrow keys
+        return 3 if len(text) >= 3 else -1
+    return 1  # A lone ESC followed by another key
+
+
+def _next_key(fd: int) -> Optional[str]:
+    """Take the next key from the input buffer.
+
+    An escape sequence that is still incomplete is given a short time to
+    arrive in full, so a lone Escape key press is returned on its own.
+
+    Returns:
+        The key, or None if the buffer is empty.
+    """
+    global _input_buffer
+    if not _input_buffer:
+        return None
+    end = 1
+    if _input_buffer[0] == "\x1b":
+        end = _escape_sequence_end(_input_buffer)
+        while end == -1 and _read_input(fd, ESCAPE_TIMEOUT):
+            end = _escape_sequence_end(_input_buffer)
+        if end == -1:
+            end = len(_input_buffer)
+    key, _input_buffer = _input_buffer[:end], _input_buffer[end:]
     return key
 
 
+def has_pending_key() -> bool:
+    """Check whether a key press is waiting to be read.
+
+    Lets a caller apply a burst of buffered key presses (e.g. a held key)
+    before redrawing, instead of redrawing once per key.
+
+    Returns:
+        True if the next get_key() call will return without blocking.
+    """
+    if _input_buffer:
+        return True
+    with RawInput():
+        return _read_input(sys.stdin.fileno(), 0)
+
+
 def hide_cursor() -> None:
     sys.stdout.write("\033[?25l")
     sys.stdout.flush()
@@ -44,6 +258,32 @@ def show_cursor() -> None:
     sys.stdout.flush()
 
 
+class RawInput:
+    """Keeps the terminal in raw mode while in use.
+
+    get_key() and has_pending_key() switch the terminal into raw mode and
+    back on every call unless a RawInput is active, so a loop reading many
+    keys can hold raw mode for its whole run instead. Can be nested.
+    """
+
+    def __enter__(self):
+        global _raw_input_depth
+        if not _raw_input_depth:
+            fd = sys.stdin.fileno()
+            _, raw_mode = _get_tty_modes(fd)
+            termios.tcsetattr(fd, termios.TCSANOW, raw_mode)
+        _raw_input_depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        global _raw_input_depth
+        _raw_input_depth -= 1
+        if not _raw_input_depth:
+            fd = sys.stdin.fileno()
+            normal_mode, _ = _get_tty_modes(fd)
+            termios.tcsetattr(fd, termios.TCSADRAIN, normal_mode)
+
+
 class CursorManager:
     def __enter__(self):
         hide_cursor()
@@ -51,3 +291,32 @@ class CursorManager:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         show_cursor()
+
+
+class ResizeWatcher:
+    """Reports terminal resizes signalled by SIGWINCH while in use.
+
+    Lets callers keep layout values between key presses and only recompute
+    them after a resize. Without SIGWINCH every check reports a resize.
+    """
+
+    def __init__(self):
+        self._generation: Optional[int] = None
+
+    def __enter__(self):
+        track_resizes()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    def check(self) -> bool:
+        """Check whether the terminal was resized since the last check.
+
+        Returns:
+            True on the first check and after every resize.
+        """
+        generation = _resize_generation
+        resized = generation != self._generation or not _tracking_resizes
+        self._generation = generation
+        return resized
@@ -1,8 +1,15 @@
 """Text formatting and pagination utilities for tRead."""
 
+import functools
+import operator
 import textwrap
 import re
-from typing import List, Tuple
+from itertools import islice, zip_longest
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+# Rich markup tags, capturing the slash of closing tags and the tag name
+# with any attributes
+_TAG_RE = re.compile(r"\[(/?)([a-zA-Z0-9_]+(?:\s+[^]]*)?)\]")
 
 
 def parse_markup_tags(line: str) -> Tuple[List[str], List[str]]:
@@ -14,21 +21,17 @@ def parse_markup_tags(line: str) -> Tuple[List[str], List[str]]:
     Returns:
         Tuple of (opening_tags, closing_tags) found in the line.
     """
-    # Pattern to match Rich markup tags
-    tag_pattern = r"\[/?([a-zA-Z0-9_]+(?:\s+[^]]*)?)\]"
-
     opening_tags = []
     closing_tags = []
 
-    for match in re.finditer(tag_pattern, line):
-        tag = match.group(0)
-        if tag.startswith("[/"):
+    # findall() scans the whole line in one call, giving the groups of each
+    # tag without building match objects
+    for slash, tag_name in _TAG_RE.findall(line):
+        if slash:
             # Closing tag
-            tag_name = tag[2:-1]  # Remove [/ and ]
             closing_tags.append(tag_name)
         else:
             # Opening tag
-            tag_name = tag[1:-1]  # Remove [ and ]
             # Handle tags with attributes (like "bold red")
             tag_name = tag_name.split()[0] if " " in tag_name else tag_name
             opening_tags.append(tag_name)
@@ -36,19 +39,36 @@ def parse_markup_tags(line: str) -> Tuple[List[str], List[str]]:
     return opening_tags, closing_tags
 
 
-def track_open_tags(lines: List[str]) -> List[str]:
+@functools.lru_cache(maxsize=4096)
+def _line_tags(line: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Get parse_markup_tags() of a line, parsing each distinct line once.
+
+    Pagination tracks the tags of the same lines several times per page.
+    """
+    opening, closing = parse_markup_tags(line)
+    return tuple(opening), tuple(closing)
+
+
+def track_open_tags(
+    lines: Iterable[str], initial: Optional[List[str]] = None
+) -> List[str]:
     """Track which markup tags are open at the end of a list of lines.
 
     Args:
         lines: List of text lines with potential markup.
+        initial: Tags already open before the first line.
 
     Returns:
         List of tag names that are currently open.
     """
-    open_tags = []
+    # Kept as an ordered list rather than counts: pages reopen carried tags
+    # in this order, and it is only as long as the markup's nesting depth
+    open_tags = list(initial) if initial else []
 
     for line in lines:
-        opening, closing = parse_markup_tags(line)
+        if "[" not in line:
+            continue  # No tags to parse
+        opening, closing = _line_tags(line)
 
         # Add opening tags
         open_tags.extend(opening)
@@ -56,11 +76,10 @@ def track_open_tags(lines: List[str]) -> List[str]:
         # Remove closing tags (in reverse order)
         for tag in closing:
             if tag in open_tags:
-                # Remove the most recent occurrence
-                for i in range(len(open_tags) - 1, -1, -1):
-                    if open_tags[i] == tag:
-                        open_tags.pop(i)
-                        break
+                # Remove the most recent occurrence, searching backwards
+                # through a reverse iterator rather than a reversed copy
+                position = operator.indexOf(reversed(open_tags), tag)
+                del open_tags[len(open_tags) - 1 - position]
 
     return open_tags
 
@@ -77,9 +96,7 @@ def close_open_tags(open_tags: List[str]) -> str:
     if not open_tags:
         return ""
 
-    # Close tags in reverse order (LIFO)
-    closing_tags = [f"[/{tag}]" for tag in reversed(open_tags)]
-    return "".join(closing_tags)
+    return _closing_tags(tuple(open_tags))
 
 
 def open_tags_string(open_tags: List[str]) -> str:
@@ -94,8 +111,20 @@ def open_tags_string(open_tags: List[str]) -> str:
     if not open_tags:
         return ""
 
-    opening_tags = [f"[{tag}]" for tag in open_tags]
-    return "".join(opening_tags)
+    return _opening_tags(tuple(open_tags))
+
+
+@functools.lru_cache(maxsize=256)
+def _closing_tags(open_tags: Tuple[str, ...]) -> str:
+    """Build the string closing open tags; the same few sets recur often."""
+    # Close tags in reverse order (LIFO)
+    return "".join(f"[/{tag}]" for tag in reversed(open_tags))
+
+
+@functools.lru_cache(maxsize=256)
+def _opening_tags(open_tags: Tuple[str, ...]) -> str:
+    """Build the string opening tags; the same few sets recur often."""
+    return "".join(f"[{tag}]" for tag in open_tags)
 
 
 def wrap_text_to_width(text: str, width: int) -> List[str]:
@@ -107,13 +136,65 @@ def wrap_text_to_width(text: str, width: int) -> List[str]:
     Returns:
         List of wrapped lines.
     """
-    wrapped_lines = []
-    for line in text.split("\n"):
-        if line.strip():  # Non-empty line
-            wrapped_lines.extend(textwrap.wrap(line, width) or [""])
-        else:  # Empty line (preserve spacing)
-            wrapped_lines.append("")
-    return wrapped_lines
+    return list(_iter_wrapped_lines(text.split("\n"), width))
+
+
+@functools.lru_cache(maxsize=8)
+def _get_wrapper(width: int) -> textwrap.TextWrapper:
+    """Get a shared TextWrapper with textwrap.wrap()'s defaults for a width."""
+    return textwrap.TextWrapper(width=width)
+
+
+def _iter_wrapped_lines(paragraphs: Iterable[str], width: int) -> Iterator[str]:
+    """Lazily wrap lines of text, yielding the lines of wrap_text_to_width()."""
+    wrap = _get_wrapper(width).wrap
+    for line in paragraphs:
+        if not line or line.isspace():  # Empty line (preserve spacing)
+            yield ""
+        elif not line.isprintable():
+            # Tabs and other whitespace are for textwrap to replace
+            yield from wrap(line) or [""]
+        elif len(line) <= width:
+            # Fits as it is; wrapping would only drop the trailing spaces
+            yield line.rstrip(" ")
+        elif "-" in line or "  " in line or line[0] == " ":
+            # Hyphens, runs of spaces and indents are for textwrap to handle
+            yield from wrap(line) or [""]
+        else:
+            words = line.rstrip(" ").split(" ")
+            if max(map(len, words)) > width:
+                # Too long words are for textwrap to break
+                yield from wrap(line)
+            else:
+                yield from _wrap_words(words, width)
+
+
+def _wrap_words(words: List[str], width: int) -> List[str]:
+    """Greedily wrap words separated by single spaces.
+
+    Gives the lines textwrap would for text with no hyphens, runs of
+    spaces, leading spaces or words longer than the width.
+
+    Args:
+        words: Words of the text, in order.
+        width: Maximum width in characters.
+
+    Returns:
+        List of wrapped lines.
+    """
+    lines = []
+    start = 0
+    length = len(words[0])
+    for i in range(1, len(words)):
+        word_length = len(words[i])
+        if length + 1 + word_length <= width:
+            length += 1 + word_length
+        else:
+            lines.append(" ".join(words[start:i]))
+            start = i
+            length = word_length
+    lines.append(" ".join(words[start:]))
+    return lines
 
 
 def create_pages(lines: List[str], visible_height: int) -> List[List[str]]:
@@ -126,25 +207,39 @@ def create_pages(lines: List[str], visible_height: int) -> List[List[str]]:
     Returns:
         List of pages, where each page is a list of lines with balanced markup tags.
     """
-    pages = []
-    current_page = []
-    current_open_tags = []  # Track tags open at start of current page
+    return list(_iter_pages(lines, visible_height))
 
-    i = 0
-    while i < len(lines):
-        # Add lines to current page until we reach capacity
-        while len(current_page) < visible_height and i < len(lines):
-            current_page.append(lines[i])
-            i += 1
+
+def _iter_pages(lines: Iterable[str], visible_height: int) -> Iterator[List[str]]:
+    """Lazily group lines into the pages of create_pages().
+
+    Lines are pulled from the iterable only as each page is filled, so the
+    input does not need to be materialized. Pages are sliced off the front
+    of a window holding at most one page and one line of lookahead.
+    """
+    if visible_height <= 0:
+        # No line fits on a page
+        return
+
+    source = iter(lines)
+    window: List[str] = []  # Lines pulled from source but not yet paged
+    current_open_tags: List[str] = []  # Track tags open at start of current page
+
+    while True:
+        # Fill a page, plus one line to see whether any are left after it
+        window.extend(islice(source, visible_height + 1 - len(window)))
+        if not window:
+            return
 
         # If we're at capacity but not at a paragraph break, try to find one
-        if len(current_page) == visible_height and i < len(lines):
+        if len(window) > visible_height:
             # Look backwards for a good breaking point (empty line = paragraph end)
-            for j in range(len(current_page) - 1, max(0, len(current_page) - 5), -1):
-                if current_page[j] == "":  # Found empty line (paragraph break)
-                    # Split here: keep everything up to and including the empty line
-                    page_content = current_page[: j + 1]
-                    remaining = current_page[j + 1 :]
+            for j in range(visible_height - 1, max(0, visible_height - 5), -1):
+                if window[j] == "":  # Found empty line (paragraph break)
+                    # Split here: keep everything up to and including the empty line,
+                    # leaving the remaining lines in the window for the next page
+                    page_content = window[: j + 1]
+                    del window[: j + 1]
 
                     # Handle markup continuity
                     page_content = _finalize_page_markup(
@@ -152,41 +247,52 @@ def create_pages(lines: List[str], visible_height: int) -> List[List[str]]:
                     )
 
                     # Track open tags for next page
-                    current_open_tags = track_open_tags(
-                        [open_tags_string(current_open_tags)] + page_content
-                    )
+                    current_open_tags = track_open_tags(page_content, current_open_tags)
 
                     # Fill rest of page with empty lines
-                    while len(page_content) < visible_height:
-                        page_content.append("")
-
-                    pages.append(page_content)
+                    page_content.extend(("",) * (visible_height - len(page_content)))
 
-                    # Put the remaining lines back for next page
-                    i = i - len(remaining)
-                    current_page = []
+                    yield page_content
                     break
             else:
                 # No good break found, just use the full page
-                page_content = _finalize_page_markup(current_page[:], current_open_tags)
-                current_open_tags = track_open_tags(
-                    [open_tags_string(current_open_tags)] + current_page
-                )
-                pages.append(page_content)
-                current_page = []
+                page_lines = window[:visible_height]
+                del window[:visible_height]
+                # The open tags are tracked over the lines as they were, before
+                # _finalize_page_markup() rewrites them in place
+                next_open_tags = track_open_tags(page_lines, current_open_tags)
+                page_content = _finalize_page_markup(page_lines, current_open_tags)
+                current_open_tags = next_open_tags
+                yield page_content
         else:
             # Page isn't full or we're at the end
-            if current_page:
-                page_content = _finalize_page_markup(current_page[:], current_open_tags)
+            page_content = _finalize_page_markup(window, current_open_tags)
 
-                # Fill remaining space with empty lines
-                while len(page_content) < visible_height:
-                    page_content.append("")
+            # Fill remaining space with empty lines
+            page_content.extend(("",) * (visible_height - len(page_content)))
 
-                pages.append(page_content)
-                current_page = []
+            yield page_content
+            return
 
-    return pages
+
+def wrap_paginate(
+    paragraphs: Iterable[str], text_width: int, visible_height: int
+) -> Iterator[List[str]]:
+    """Wrap and paginate text in a single streaming pass.
+
+    Produces the same pages as wrap_text_to_width() and create_pages()
+    chained together, without building the intermediate list of lines.
+
+    Args:
+        paragraphs: Lines of the text to paginate, as split on newlines.
+        text_width: Width available for the text of a page.
+        visible_height: Number of lines that fit on one page.
+
+    Returns:
+        Iterator over the finished pages.
+    """
+    lines = _iter_wrapped_lines(paragraphs, text_width)
+    return _iter_pages(lines, visible_height)
 
 
 def _finalize_page_markup(
@@ -195,7 +301,7 @@ def _finalize_page_markup(
     """Finalize a page by ensuring markup tags are balanced.
 
     Args:
-        page_content: List of lines for this page.
+        page_content: List of lines for this page, modified in place.
         start_open_tags: Tags that were open at the start of this page.
 
     Returns:
@@ -204,119 +310,95 @@ def _finalize_page_markup(
     if not page_content:
         return page_content
 
-    # If we have tags open from previous page, prepend them to first non-empty line
+    # Track all open tags at the end of this page. If we have tags open from
+    # previous page, prepend them to first non-empty line; they are tracked
+    # from the lines as they were, with the prepended tags opened on top of
+    # the carried ones, so the rewritten line is not parsed again.
+    all_open_tags = start_open_tags
     if start_open_tags:
         for i, line in enumerate(page_content):
-            if line.strip():  # First non-empty line
+            if line and not line.isspace():  # First non-empty line
+                all_open_tags = track_open_tags(page_content, start_open_tags * 2)
                 page_content[i] = open_tags_string(start_open_tags) + line
                 break
-
-    # Track all open tags at the end of this page
-    all_open_tags = track_open_tags([open_tags_string(start_open_tags)] + page_content)
+    else:
+        all_open_tags = track_open_tags(page_content)
 
     # If there are open tags at the end, close them on the last non-empty line
     if all_open_tags:
         for i in range(len(page_content) - 1, -1, -1):
-            if page_content[i].strip():  # Last non-empty line
-                page_content[i] = page_content[i] + close_open_tags(all_open_tags)
+            line = page_content[i]
+            if line and not line.isspace():  # Last non-empty line
+                page_content[i] = line + close_open_tags(all_open_tags)
                 break
 
     return page_content
 
 
-def create_double_pages(
-    pages: List[List[str]], separator: str = " │ "
-) -> List[List[str]]:
-    """Convert single pages to double pages for side-by-side reading.
+def double_page_wrap_width(text_width: int, separator: str = " │ ") -> int:
+    """Get the width each page of a double page is wrapped to.
 
     Args:
-        pages: List of single pages.
+        text_width: Width available for both pages and the separator.
         separator: String to separate left and right pages.
 
     Returns:
-        List of double pages, where each double page combines two single pages side by side.
+        Wrap width of a single page, leaving a margin inside its column.
     """
-    if not pages:
-        return []
+    return max(20, (text_width - len(separator)) // 2 - 2)
 
-    double_pages = []
-
-    # Process pages in pairs
-    for i in range(0, len(pages), 2):
-        left_page = pages[i]
-        right_page = pages[i + 1] if i + 1 < len(pages) else [""] * len(left_page)
-
-        # Ensure both pages have the same height
-        max_height = max(len(left_page), len(right_page))
-        while len(left_page) < max_height:
-            left_page.append("")
-        while len(right_page) < max_height:
-            right_page.append("")
-
-        # Calculate column width for each page (accounting for separator)
-        # We'll make each column roughly half the available width
-        combined_page = []
-        for j in range(max_height):
-            left_line = left_page[j] if j < len(left_page) else ""
-            right_line = right_page[j] if j < len(right_page) else ""
-            combined_line = left_line + separator + right_line
-            combined_page.append(combined_line)
-
-        double_pages.append(combined_page)
-
-    return double_pages
 
+def compose_double_page(
+    pages: List[List[str]], index: int, total_width: int, separator: str = " │ "
+) -> List[str]:
+    """Compose one double page from a chapter's single pages.
 
-def create_double_pages_with_width(
-    pages: List[List[str]], total_width: int, separator: str = " │ "
-) -> List[List[str]]:
-    """Convert single pages to double pages with proper width management.
+    The single pages are paired up in order, and an odd last page gets an
+    empty right page. Only the requested pair is composed, and the single
+    pages are left unmodified.
 
     Args:
         pages: List of single pages.
+        index: Index of the double page.
         total_width: Total available width for the double page display.
         separator: String to separate left and right pages.
 
     Returns:
-        List of double pages properly formatted for the given width.
+        Lines of the double page.
     """
-    if not pages:
-        return []
-
-    # Calculate width for each column
-    separator_width = len(separator)
-    column_width = (total_width - separator_width) // 2
-
-    double_pages = []
-
-    # Process pages in pairs
-    for i in range(0, len(pages), 2):
-        left_page = pages[i]
-        right_page = pages[i + 1] if i + 1 < len(pages) else [""] * len(left_page)
-
-        # Ensure both pages have the same height
-        max_height = max(len(left_page), len(right_page))
-        while len(left_page) < max_height:
-            left_page.append("")
-        while len(right_page) < max_height:
-            right_page.append("")
-
-        # Format each line to fit within column width
-        combined_page = []
-        for j in range(max_height):
-            left_line = left_page[j] if j < len(left_page) else ""
-            right_line = right_page[j] if j < len(right_page) else ""
+    left_page = pages[2 * index]
+    if 2 * index + 1 < len(pages):
+        right_page = pages[2 * index + 1]
+    else:
+        right_page = [""] * len(left_page)
+    column_width = (total_width - len(separator)) // 2
+    return _combine_pages(left_page, right_page, column_width, separator)
 
-            # Clean and format lines to fit column width
-            left_formatted = _format_line_for_column(left_line, column_width)
-            right_formatted = _format_line_for_column(right_line, column_width)
 
-            combined_line = left_formatted + separator + right_formatted
-            combined_page.append(combined_line)
+def _combine_pages(
+    left_page: Sequence[str],
+    right_page: Sequence[str],
+    column_width: int,
+    separator: str,
+) -> List[str]:
+    """Lay out two single pages side by side as one double page.
 
-        double_pages.append(combined_page)
+    Args:
+        left_page: Lines of the left page.
+        right_page: Lines of the right page.
+        column_width: Width of each page's column.
+        separator: String to separate left and right pages.
 
-    return double_pages
+    Returns:
+        Lines of the combined page.
+    """
+    # The shorter page is padded with empty lines to the other's height
+    return [
+        _format_line_for_column(left_line, column_width)
+        + separator
+        + _format_line_for_column(right_line, column_width)
+        for left_line, right_line in zip_longest(left_page, right_page, fillvalue="")
+    ]
 
 
 def _format_line_for_column(line: str, column_width: int) -> str:
@@ -329,22 +411,18 @@ def _format_line_for_column(line: str, column_width: int) -> str:
     Returns:
         Formatted line that fits within the column width.
     """
-    if not line.strip():
+    if not line or line.isspace():
         # Empty line - just pad to column width
         return " " * column_width
 
     # For lines with content, we need to handle Rich markup carefully
     # First, let's get the visible length (without markup)
-    import re
-
-    # Remove Rich markup to calculate visible length
-    visible_text = re.sub(r"\[/?[^\]]*\]", "", line)
-    visible_length = len(visible_text)
+    visible_length = _visible_length(line)
 
     if visible_length <= column_width:
-        # Line fits, pad with spaces to column width
-        padding_needed = column_width - visible_length
-        return line + (" " * padding_needed)
+        # Line fits, pad with spaces to column width. The markup takes up
+        # characters but no columns, so it is added to the padded length.
+        return line.ljust(len(line) + column_width - visible_length)
     else:
         # Line is too long, we need to truncate it
         # This is tricky with markup, so for now we'll do a simple truncation
@@ -352,6 +430,29 @@ def _format_line_for_column(line: str, column_width: int) -> str:
         return line[:column_width]
 
 
+def _visible_length(line: str) -> int:
+    """Get the length of a line without anything in square brackets.
+
+    Each "[" up to the first "]" after it is skipped, in one scan and
+    without building the stripped text.
+
+    Args:
+        line: Line possibly containing Rich markup.
+
+    Returns:
+        Number of characters outside of brackets.
+    """
+    length = len(line)
+    start = line.find("[")
+    while start >= 0:
+        end = line.find("]", start + 1)
+        if end < 0:
+            break
+        length -= end - start + 1
+        start = line.find("[", end + 1)
+    return length
+
+
 def sanitize_markup(text: str) -> str:
     """Sanitize text to prevent Rich markup errors by balancing tags.
 
@@ -361,40 +462,41 @@ def sanitize_markup(text: str) -> str:
     Returns:
         Text with balanced markup tags.
     """
-    import re
-
-    # Find all markup tags
-    tag_pattern = r"\[/?([a-zA-Z0-9_]+(?:\s+[^\]]*)?)\]"
+    # Text without brackets has no tags to balance
+    if "[" not in text:
+        return text
 
     # Track open tags
     open_tags = []
     result_lines = []
 
     for line in text.split("\n"):
-        # Find all tags in this line
-        matches = list(re.finditer(tag_pattern, line))
+        # Pieces of the line around the tags removed from it
+        kept = []
+        kept_from = 0
 
-        for match in matches:
-            tag = match.group(0)
-            if tag.startswith("[/"):
+        for match in _TAG_RE.finditer(line):
+            slash, tag_name = match.groups()
+            if slash:
                 # Closing tag
-                tag_name = tag[2:-1]
                 if tag_name in open_tags:
                     open_tags.remove(tag_name)
                 else:
                     # Unmatched closing tag - remove it
-                    line = line.replace(tag, "", 1)
+                    kept.append(line[kept_from : match.start()])
+                    kept_from = match.end()
             else:
                 # Opening tag
-                tag_name = tag[1:-1].split()[0] if " " in tag[1:-1] else tag[1:-1]
+                tag_name = tag_name.split()[0] if " " in tag_name else tag_name
                 open_tags.append(tag_name)
 
+        if kept:
+            kept.append(line[kept_from:])
+            line = "".join(kept)
         result_lines.append(line)
 
     # Close any remaining open tags at the end
-    if open_tags:
-        closing_tags = "".join(f"[/{tag}]" for tag in reversed(open_tags))
-        if result_lines:
-            result_lines[-1] += closing_tags
+    if open_tags and result_lines:
+        result_lines[-1] += close_open_tags(open_tags)
 
     return "\n".join(result_lines)